@@ -34,6 +34,7 @@ def launch_character_pokedex():
         root = tk.Tk()
         app = CharacterPokedexUI(root)
         root.mainloop()
+        app.mathic_system.close()
     except ImportError as e:
         print(f"❌ Error importing GUI: {e}")
     except Exception as e:
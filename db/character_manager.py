@@ -14,33 +14,12 @@ class CharacterManager:
         try:
             with self.db.get_connection() as conn:
                 cursor = conn.cursor()
-                
-                basic_info = character_data.get('basic_info', {})
-                name = basic_info.get('name', 'Unknown')
-                rarity = basic_info.get('rarity', 'Unknown')
-                element = basic_info.get('element', 'Unknown')
-                
-                # Insert character basic info
-                cursor.execute('''
-                    INSERT OR REPLACE INTO characters (name, rarity, element, updated_at)
-                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                ''', (name, rarity, element))
-                
-                character_id = cursor.lastrowid or self._get_character_id(cursor, name)
-                
+                character_id = self._write_character(cursor, character_data)
                 if character_id is None:
                     return None
                 
-                # Insert stats
-                self._insert_character_stats(cursor, character_id, character_data.get('stats', {}))
-                
-                # Insert skills
-                self._insert_character_skills(cursor, character_id, character_data.get('skills', []))
-                
-                # Insert dupes
-                self._insert_character_dupes(cursor, character_id, character_data.get('dupes', {}))
-                
                 conn.commit()
+                name = character_data.get('basic_info', {}).get('name', 'Unknown')
                 print(f"Character '{name}' inserted successfully with ID: {character_id}")
                 return character_id
                 
@@ -48,6 +27,60 @@ class CharacterManager:
             print(f"Error inserting character: {e}")
             return None
     
+    def insert_characters(self, characters: List[Dict]) -> List[Optional[int]]:
+        """Insert many characters in one transaction and return their IDs (None on failure)"""
+        character_ids = []
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            # Join a transaction the caller already opened instead of committing it early
+            owns_transaction = not conn.in_transaction
+            if owns_transaction:
+                cursor.execute('BEGIN')
+            
+            for character_data in characters:
+                # A savepoint per character keeps one bad entry from undoing the others
+                cursor.execute('SAVEPOINT character_insert')
+                try:
+                    character_ids.append(self._write_character(cursor, character_data))
+                except Exception as e:
+                    print(f"Error inserting character: {e}")
+                    cursor.execute('ROLLBACK TO character_insert')
+                    character_ids.append(None)
+                cursor.execute('RELEASE character_insert')
+            
+            if owns_transaction:
+                conn.commit()
+        return character_ids
+    
+    def _write_character(self, cursor, character_data: Dict) -> Optional[int]:
+        """Write a character with its stats, skills and dupes without committing"""
+        basic_info = character_data.get('basic_info', {})
+        name = basic_info.get('name', 'Unknown')
+        rarity = basic_info.get('rarity', 'Unknown')
+        element = basic_info.get('element', 'Unknown')
+        
+        # Insert character basic info
+        cursor.execute('''
+            INSERT OR REPLACE INTO characters (name, rarity, element, updated_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        ''', (name, rarity, element))
+        
+        character_id = cursor.lastrowid or self._get_character_id(cursor, name)
+        
+        if character_id is None:
+            return None
+        
+        # Insert stats
+        self._insert_character_stats(cursor, character_id, character_data.get('stats', {}))
+        
+        # Insert skills
+        self._insert_character_skills(cursor, character_id, character_data.get('skills', []))
+        
+        # Insert dupes
+        self._insert_character_dupes(cursor, character_id, character_data.get('dupes', {}))
+        
+        return character_id
+    
     def _get_character_id(self, cursor, name: str) -> Optional[int]:
         """Get character ID by name"""
         cursor.execute('SELECT id FROM characters WHERE name = ?', (name,))
@@ -108,74 +141,25 @@ class CharacterManager:
                 VALUES (?, ?, ?, ?)
             ''', (character_id, dupe_id, dupe_name, dupe_effect))
     
+    def get_character(self, character_id: int) -> Optional[Dict]:
+        """Get complete character data by ID from the character_full view"""
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT payload FROM character_full WHERE character_id = ?', (character_id,))
+            row = cursor.fetchone()
+            return json.loads(row['payload']) if row else None
+    
     def get_character_by_name(self, name: str) -> Optional[Dict]:
         """Get complete character data by name"""
         with self.db.get_connection() as conn:
             cursor = conn.cursor()
-            
-            cursor.execute('SELECT * FROM characters WHERE name = ?', (name,))
-            character_row = cursor.fetchone()
-            
-            if not character_row:
-                return None
-            
-            character_id = character_row['id']
-            
-            character_data = {
-                'basic_info': {
-                    'name': character_row['name'],
-                    'rarity': character_row['rarity'],
-                    'element': character_row['element']
-                },
-                'stats': {},
-                'skills': [],
-                'dupes': {}
-            }
-            
-            # Get stats
-            cursor.execute('''
-                SELECT * FROM character_stats 
-                WHERE character_id = ? 
-                ORDER BY stat_name
-            ''', (character_id,))
-            
-            for stat_row in cursor.fetchall():
-                character_data['stats'][stat_row['stat_name']] = {
-                    'total': stat_row['total_value'],
-                    'base': stat_row['base_value'],
-                    'bonus': stat_row['bonus_value']
-                }
-            
-            # Get skills
             cursor.execute('''
-                SELECT * FROM character_skills 
-                WHERE character_id = ? 
-                ORDER BY skill_number
-            ''', (character_id,))
-            
-            for skill_row in cursor.fetchall():
-                skill_data = {
-                    'name': skill_row['skill_name'],
-                    'effect': skill_row['skill_effect'],
-                    'cooldown': skill_row['cooldown'],
-                    'tags': json.loads(skill_row['tags'] or '[]')
-                }
-                character_data['skills'].append(skill_data)
-            
-            # Get dupes
-            cursor.execute('''
-                SELECT * FROM character_dupes 
-                WHERE character_id = ? 
-                ORDER BY dupe_id
-            ''', (character_id,))
-            
-            for dupe_row in cursor.fetchall():
-                character_data['dupes'][dupe_row['dupe_id']] = {
-                    'name': dupe_row['dupe_name'],
-                    'effect': dupe_row['dupe_effect']
-                }
-            
-            return character_data
+                SELECT f.payload FROM characters c
+                JOIN character_full f ON f.character_id = c.id
+                WHERE c.name = ?
+            ''', (name,))
+            row = cursor.fetchone()
+            return json.loads(row['payload']) if row else None
     
     def get_all_characters(self) -> List[Dict]:
         """Get list of all characters with basic info"""
@@ -189,6 +173,22 @@ class CharacterManager:
             
             return characters
     
+    def get_characters_by_skill_tag(self, tag: str) -> List[Dict]:
+        """Get characters that have at least one skill with the given tag"""
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT * FROM characters
+                WHERE id IN (
+                    SELECT s.character_id FROM character_skill_tags t
+                    JOIN character_skills s ON s.id = t.skill_id
+                    WHERE t.tag = ?
+                )
+                ORDER BY name
+            ''', (tag,))
+            
+            return [dict(row) for row in cursor.fetchall()]
+    
     def equip_shell(self, character_name: str, shell_name: str) -> bool:
         """Equip a shell to a character"""
         with self.db.get_connection() as conn:
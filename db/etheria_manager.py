@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from typing import Dict, List, Optional
 from .unified_db import EtheriaDatabase
 from .character_manager import CharacterManager
@@ -17,6 +18,22 @@ class EtheriaManager:
         self.matrices = MatrixManager(self.db)
         self.shells = ShellManager(self.db)
     
+    @contextmanager
+    def transaction(self):
+        """Run the enclosed manager writes in one transaction, committed when the block succeeds"""
+        with self.db.get_connection() as conn:
+            # Batch inserts of every sub-manager join this transaction instead of committing their own
+            owns_transaction = not conn.in_transaction
+            if owns_transaction:
+                conn.execute('BEGIN')
+            yield conn
+            if owns_transaction:
+                conn.commit()
+    
+    def close(self):
+        """Close the shared database connection, refreshing planner statistics first"""
+        self.db.close()
+    
     def get_comprehensive_stats(self) -> Dict:
         """Get comprehensive statistics from all modules"""
         base_stats = self.db.get_database_stats()
@@ -300,7 +317,7 @@ class EtheriaManager:
             export_data = {
                 'metadata': {
                     'database_stats': self.get_comprehensive_stats(),
-                    'export_timestamp': self.db.execute_query('SELECT CURRENT_TIMESTAMP as ts')[0]['ts']
+                    'export_timestamp': self.db.execute_query('SELECT CURRENT_TIMESTAMP as ts', as_dict=False)[0]['ts']
                 },
                 'characters': [],
                 'shells': [],
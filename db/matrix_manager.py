@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from .unified_db import EtheriaDatabase
 
 
@@ -13,51 +13,10 @@ class MatrixManager:
         try:
             with self.db.get_connection() as conn:
                 cursor = conn.cursor()
-                
-                # Insert basic matrix info
-                cursor.execute('''
-                    INSERT OR REPLACE INTO matrix_effects (name, source, updated_at)
-                    VALUES (?, ?, CURRENT_TIMESTAMP)
-                ''', (matrix_data['name'], matrix_data['source']))
-                
-                matrix_id = cursor.lastrowid or self._get_matrix_id(cursor, matrix_data['name'])
-                
+                matrix_id = self._write_matrix_effect(cursor, matrix_data)
                 if matrix_id is None:
                     return None
                 
-                # Delete existing related data if updating
-                cursor.execute('DELETE FROM matrix_types WHERE matrix_id = ?', (matrix_id,))
-                cursor.execute('DELETE FROM matrix_effect_tiers WHERE matrix_id = ?', (matrix_id,))
-                
-                # Insert matrix types
-                for type_name in matrix_data.get('type', []):
-                    cursor.execute('''
-                        INSERT INTO matrix_types (matrix_id, type_name)
-                        VALUES (?, ?)
-                    ''', (matrix_id, type_name))
-                
-                # Insert effect tiers and their stats
-                for effect in matrix_data.get('effects', []):
-                    cursor.execute('''
-                        INSERT INTO matrix_effect_tiers 
-                        (matrix_id, required_count, total_count, extra_effect)
-                        VALUES (?, ?, ?, ?)
-                    ''', (
-                        matrix_id, 
-                        effect['required'], 
-                        effect['total'],
-                        effect.get('extra_effect', None)
-                    ))
-                    
-                    tier_id = cursor.lastrowid
-                    
-                    # Insert stat bonuses for this tier
-                    for stat_name, stat_value in effect.get('effect', {}).items():
-                        cursor.execute('''
-                            INSERT INTO matrix_effect_stats (tier_id, stat_name, stat_value)
-                            VALUES (?, ?, ?)
-                        ''', (tier_id, stat_name, stat_value))
-                
                 conn.commit()
                 print(f"Matrix effect '{matrix_data['name']}' inserted successfully with ID: {matrix_id}")
                 return matrix_id
@@ -66,6 +25,79 @@ class MatrixManager:
             print(f"Error inserting matrix effect: {e}")
             return None
     
+    def insert_matrix_effects(self, matrices: List[Dict]) -> List[Optional[int]]:
+        """Insert many matrix effects in one transaction and return their IDs (None on failure)"""
+        matrix_ids = []
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            # Join a transaction the caller already opened instead of committing it early
+            owns_transaction = not conn.in_transaction
+            if owns_transaction:
+                cursor.execute('BEGIN')
+            
+            for matrix_data in matrices:
+                # A savepoint per matrix keeps one bad entry from undoing the others
+                cursor.execute('SAVEPOINT matrix_insert')
+                try:
+                    matrix_ids.append(self._write_matrix_effect(cursor, matrix_data))
+                except Exception as e:
+                    print(f"Error inserting matrix effect: {e}")
+                    cursor.execute('ROLLBACK TO matrix_insert')
+                    matrix_ids.append(None)
+                cursor.execute('RELEASE matrix_insert')
+            
+            if owns_transaction:
+                conn.commit()
+        return matrix_ids
+    
+    def _write_matrix_effect(self, cursor, matrix_data: Dict) -> Optional[int]:
+        """Write a matrix effect and its types, tiers and stats without committing"""
+        # Insert basic matrix info
+        cursor.execute('''
+            INSERT OR REPLACE INTO matrix_effects (name, source, updated_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+        ''', (matrix_data['name'], matrix_data['source']))
+        
+        matrix_id = cursor.lastrowid or self._get_matrix_id(cursor, matrix_data['name'])
+        
+        if matrix_id is None:
+            return None
+        
+        # Delete existing related data if updating
+        cursor.execute('DELETE FROM matrix_types WHERE matrix_id = ?', (matrix_id,))
+        cursor.execute('DELETE FROM matrix_effect_tiers WHERE matrix_id = ?', (matrix_id,))
+        
+        # Insert matrix types
+        for type_name in matrix_data.get('type', []):
+            cursor.execute('''
+                INSERT INTO matrix_types (matrix_id, type_name)
+                VALUES (?, ?)
+            ''', (matrix_id, type_name))
+        
+        # Insert effect tiers and their stats
+        for effect in matrix_data.get('effects', []):
+            cursor.execute('''
+                INSERT INTO matrix_effect_tiers 
+                (matrix_id, required_count, total_count, extra_effect)
+                VALUES (?, ?, ?, ?)
+            ''', (
+                matrix_id, 
+                effect['required'], 
+                effect['total'],
+                effect.get('extra_effect', None)
+            ))
+            
+            tier_id = cursor.lastrowid
+            
+            # Insert stat bonuses for this tier
+            for stat_name, stat_value in effect.get('effect', {}).items():
+                cursor.execute('''
+                    INSERT INTO matrix_effect_stats (tier_id, stat_name, stat_value)
+                    VALUES (?, ?, ?)
+                ''', (tier_id, stat_name, stat_value))
+        
+        return matrix_id
+    
     def _get_matrix_id(self, cursor, name: str) -> Optional[int]:
         """Get matrix ID by name"""
         cursor.execute('SELECT id FROM matrix_effects WHERE name = ?', (name,))
@@ -135,6 +167,13 @@ class MatrixManager:
             matrix_data['effects'] = effects
             return matrix_data
     
+    def get_matrix_names(self) -> Set[str]:
+        """Get the names of all matrix effects"""
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT name FROM matrix_effects')
+            return {row[0] for row in cursor.fetchall()}
+    
     def get_all_matrix_effects(self) -> List[Dict]:
         """Get all matrix effects with their data"""
         with self.db.get_connection() as conn:
@@ -251,8 +290,12 @@ class MatrixManager:
             
             return usage_stats
     
-    def create_placeholder_matrix(self, name: str, source: str = "auto_generated") -> Optional[int]:
-        """Create a placeholder matrix effect for missing references"""
+    def create_placeholder_matrix(self, name: str, source: str = "auto_generated", cursor=None) -> Optional[int]:
+        """Create a placeholder matrix effect for missing references
+        
+        Args:
+            cursor: If given, write through it inside the caller's transaction without committing
+        """
         placeholder_data = {
             'name': name,
             'source': source,
@@ -275,4 +318,6 @@ class MatrixManager:
             ]
         }
         
+        if cursor is not None:
+            return self._write_matrix_effect(cursor, placeholder_data)
         return self.insert_matrix_effect(placeholder_data)
@@ -1,62 +1,112 @@
+from functools import partial
 from typing import Dict, List, Optional
 from .unified_db import EtheriaDatabase
 import json
 
 
+# Compact, non-ASCII-preserving JSON encoder for stored skill content
+_dumps = partial(json.dumps, ensure_ascii=False, separators=(',', ':'))
+
+
 class ShellManager:
     """Shell management operations using unified database"""
     
     def __init__(self, db: EtheriaDatabase):
         self.db = db
+        # In-memory shell catalog keyed by name, reloaded after any database write
+        self._cache: Optional[Dict[str, Dict]] = None
+        self._cache_generation = None
+    
+    def invalidate_cache(self):
+        """Drop the in-memory shell catalog so the next read reloads it"""
+        self._cache = None
+    
+    def _get_catalog(self) -> Dict[str, Dict]:
+        """Get the cached shell catalog, loading it from the database if stale"""
+        if self._cache is None or self._cache_generation != self.db.write_generation:
+            self._cache_generation = self.db.write_generation
+            self._cache = self._load_catalog()
+        return self._cache
+    
+    def _load_catalog(self) -> Dict[str, Dict]:
+        """Load every shell with its skills, stats and matrix compatibility in one pass"""
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT id, name, rarity, class, cooldown, created_at, updated_at
+                FROM shells
+                ORDER BY name
+            ''')
+            
+            catalog = {}
+            shells_by_id = {}
+            for shell_row in cursor.fetchall():
+                shell_data = dict(shell_row)
+                catalog[shell_data['name']] = shell_data
+                shells_by_id[shell_data['id']] = shell_data
+            
+            # Get skills
+            cursor.execute('''
+                SELECT shell_id, skill_type, skill_content FROM shell_skills
+                ORDER BY shell_id, skill_type
+            ''')
+            
+            for skill_row in cursor.fetchall():
+                shell_data = shells_by_id.get(skill_row['shell_id'])
+                if shell_data is not None:
+                    shell_data.setdefault('skills', {})[skill_row['skill_type']] = skill_row['skill_content']
+            
+            # Get stats
+            cursor.execute('''
+                SELECT shell_id, stat_name, stat_value FROM shell_stats
+                ORDER BY shell_id, stat_name
+            ''')
+            
+            for stat_row in cursor.fetchall():
+                shell_data = shells_by_id.get(stat_row['shell_id'])
+                if shell_data is not None:
+                    shell_data.setdefault('stats', {})[stat_row['stat_name']] = stat_row['stat_value']
+            
+            # Get compatible matrix effects
+            cursor.execute('''
+                SELECT smc.shell_id, me.name, smc.compatibility_score
+                FROM shell_matrix_compatibility smc
+                JOIN matrix_effects me ON me.id = smc.matrix_id
+                ORDER BY smc.id
+            ''')
+            
+            for matrix_row in cursor.fetchall():
+                shell_data = shells_by_id.get(matrix_row['shell_id'])
+                if shell_data is not None:
+                    matrix_name = matrix_row['name']
+                    shell_data.setdefault('sets', []).append(matrix_name)
+                    shell_data.setdefault('matrix_compatibility', {})[matrix_name] = matrix_row['compatibility_score']
+            
+            return catalog
+    
+    @staticmethod
+    def _copy_shell(shell_data: Dict) -> Dict:
+        """Copy a cached shell so callers can modify it without touching the cache"""
+        shell_copy = dict(shell_data)
+        for key in ('skills', 'stats', 'matrix_compatibility'):
+            if key in shell_copy:
+                shell_copy[key] = dict(shell_copy[key])
+        if 'sets' in shell_copy:
+            shell_copy['sets'] = list(shell_copy['sets'])
+        return shell_copy
     
     def insert_shell(self, shell_data: Dict) -> Optional[int]:
         """Insert a shell and return its ID"""
         try:
             with self.db.get_connection() as conn:
                 cursor = conn.cursor()
-                
-                # Insert basic shell info
-                cursor.execute('''
-                    INSERT OR REPLACE INTO shells (name, rarity, class, cooldown, updated_at)
-                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ''', (
-                    shell_data['name'], 
-                    shell_data['rarity'], 
-                    shell_data['class'],
-                    shell_data['cooldown']
-                ))
-                
-                shell_id = cursor.lastrowid or self._get_shell_id(cursor, shell_data['name'])
-                
+                shell_id = self._write_shell(cursor, shell_data)
                 if shell_id is None:
                     return None
                 
-                # Delete existing related data if updating
-                cursor.execute('DELETE FROM shell_skills WHERE shell_id = ?', (shell_id,))
-                cursor.execute('DELETE FROM shell_stats WHERE shell_id = ?', (shell_id,))
-                cursor.execute('DELETE FROM shell_matrix_compatibility WHERE shell_id = ?', (shell_id,))
-                
-                # Insert skills
-                skills = shell_data.get('skills', {})
-                for skill_type, skill_content in skills.items():
-                    cursor.execute('''
-                        INSERT INTO shell_skills (shell_id, skill_type, skill_content)
-                        VALUES (?, ?, ?)
-                    ''', (shell_id, skill_type, json.dumps(skill_content, ensure_ascii=False)))
-                
-                # Insert stats
-                stats = shell_data.get('stats', {})
-                for stat_name, stat_value in stats.items():
-                    cursor.execute('''
-                        INSERT INTO shell_stats (shell_id, stat_name, stat_value)
-                        VALUES (?, ?, ?)
-                    ''', (shell_id, stat_name, stat_value))
-                
-                # Insert matrix compatibility
-                matrix_sets = shell_data.get('sets', [])
-                self._insert_matrix_compatibility(cursor, shell_id, matrix_sets)
-                
                 conn.commit()
+                self.invalidate_cache()
                 print(f"Shell '{shell_data['name']}' inserted successfully with ID: {shell_id}")
                 return shell_id
                 
@@ -64,6 +114,75 @@ class ShellManager:
             print(f"Error inserting shell: {e}")
             return None
     
+    def insert_shells(self, shells: List[Dict]) -> List[Optional[int]]:
+        """Insert many shells in one transaction and return their IDs (None on failure)"""
+        shell_ids = []
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            # Join a transaction the caller already opened instead of committing it early
+            owns_transaction = not conn.in_transaction
+            if owns_transaction:
+                cursor.execute('BEGIN')
+            
+            for shell_data in shells:
+                # A savepoint per shell keeps one bad entry from undoing the others
+                cursor.execute('SAVEPOINT shell_insert')
+                try:
+                    shell_ids.append(self._write_shell(cursor, shell_data))
+                except Exception as e:
+                    print(f"Error inserting shell: {e}")
+                    cursor.execute('ROLLBACK TO shell_insert')
+                    shell_ids.append(None)
+                cursor.execute('RELEASE shell_insert')
+            
+            if owns_transaction:
+                conn.commit()
+        self.invalidate_cache()
+        return shell_ids
+    
+    def _write_shell(self, cursor, shell_data: Dict) -> Optional[int]:
+        """Write a shell and its skills, stats and matrix compatibility without committing"""
+        # Insert basic shell info
+        cursor.execute('''
+            INSERT OR REPLACE INTO shells (name, rarity, class, cooldown, updated_at)
+            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ''', (
+            shell_data['name'], 
+            shell_data['rarity'], 
+            shell_data['class'],
+            shell_data['cooldown']
+        ))
+        
+        shell_id = cursor.lastrowid or self._get_shell_id(cursor, shell_data['name'])
+        
+        if shell_id is None:
+            return None
+        
+        # Delete existing related data if updating
+        cursor.execute('DELETE FROM shell_skills WHERE shell_id = ?', (shell_id,))
+        cursor.execute('DELETE FROM shell_stats WHERE shell_id = ?', (shell_id,))
+        cursor.execute('DELETE FROM shell_matrix_compatibility WHERE shell_id = ?', (shell_id,))
+        
+        # Insert skills
+        skills = shell_data.get('skills', {})
+        cursor.executemany('''
+            INSERT INTO shell_skills (shell_id, skill_type, skill_content)
+            VALUES (?, ?, ?)
+        ''', [(shell_id, skill_type, _dumps(skill_content)) for skill_type, skill_content in skills.items()])
+        
+        # Insert stats
+        stats = shell_data.get('stats', {})
+        cursor.executemany('''
+            INSERT INTO shell_stats (shell_id, stat_name, stat_value)
+            VALUES (?, ?, ?)
+        ''', [(shell_id, stat_name, stat_value) for stat_name, stat_value in stats.items()])
+        
+        # Insert matrix compatibility
+        matrix_sets = shell_data.get('sets', [])
+        self._insert_matrix_compatibility(cursor, shell_id, matrix_sets)
+        
+        return shell_id
+    
     def add_matrix_compatibility(self, shell_id: int, matrix_id: int, compatibility_score: float = 100.0) -> bool:
         """Add matrix compatibility for a shell"""
         try:
@@ -77,6 +196,7 @@ class ShellManager:
                 ''', (shell_id, matrix_id, compatibility_score))
                 
                 conn.commit()
+                self.invalidate_cache()
                 print(f"Matrix compatibility added: Shell {shell_id} <-> Matrix {matrix_id}")
                 return True
                 
@@ -108,7 +228,7 @@ class ShellManager:
                 # Create placeholder matrix effect
                 from .matrix_manager import MatrixManager
                 matrix_manager = MatrixManager(self.db)
-                matrix_id = matrix_manager.create_placeholder_matrix(matrix_name, "shells_parser")
+                matrix_id = matrix_manager.create_placeholder_matrix(matrix_name, "shells_parser", cursor=cursor)
                 
                 if matrix_id:
                     cursor.execute('''
@@ -118,132 +238,36 @@ class ShellManager:
     
     def get_shell_by_name(self, name: str) -> Optional[Dict]:
         """Get a shell by name with all its data"""
-        with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Get basic shell info
-            cursor.execute('''
-                SELECT id, name, rarity, class, cooldown, created_at, updated_at
-                FROM shells
-                WHERE name = ?
-            ''', (name,))
-            
-            shell_row = cursor.fetchone()
-            if not shell_row:
-                return None
-            
-            shell_data = dict(shell_row)
-            shell_id = shell_data['id']
-            
-            # Get skills
-            cursor.execute('''
-                SELECT skill_type, skill_content FROM shell_skills
-                WHERE shell_id = ?
-                ORDER BY skill_type
-            ''', (shell_id,))
-            
-            skills = {}
-            for skill_row in cursor.fetchall():
-                skills[skill_row['skill_type']] = skill_row['skill_content']
-            
-            if skills:
-                shell_data['skills'] = skills
-            
-            # Get stats
-            cursor.execute('''
-                SELECT stat_name, stat_value FROM shell_stats
-                WHERE shell_id = ?
-                ORDER BY stat_name
-            ''', (shell_id,))
-            
-            stats = {}
-            for stat_row in cursor.fetchall():
-                stats[stat_row['stat_name']] = stat_row['stat_value']
-            
-            if stats:
-                shell_data['stats'] = stats
-            
-            # Get compatible matrix effects
-            cursor.execute('''
-                SELECT me.name, smc.compatibility_score
-                FROM matrix_effects me
-                JOIN shell_matrix_compatibility smc ON me.id = smc.matrix_id
-                WHERE smc.shell_id = ?
-                ORDER BY smc.id
-            ''', (shell_id,))
-            
-            matrix_sets = []
-            matrix_compatibility = {}
-            for matrix_row in cursor.fetchall():
-                matrix_name = matrix_row['name']
-                matrix_sets.append(matrix_name)
-                matrix_compatibility[matrix_name] = matrix_row['compatibility_score']
-            
-            if matrix_sets:
-                shell_data['sets'] = matrix_sets
-                shell_data['matrix_compatibility'] = matrix_compatibility
-            
-            return shell_data
+        shell_data = self._get_catalog().get(name)
+        return self._copy_shell(shell_data) if shell_data else None
     
     def get_all_shells(self) -> List[Dict]:
         """Get all shells with their data"""
-        with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT name FROM shells
-                ORDER BY name
-            ''')
-            
-            shells = []
-            for row in cursor.fetchall():
-                shell_data = self.get_shell_by_name(row['name'])
-                if shell_data:
-                    shells.append(shell_data)
-            
-            return shells
+        return [self._copy_shell(shell_data) for shell_data in self._get_catalog().values()]
     
     def get_shells_by_class(self, shell_class: str) -> List[Dict]:
         """Get shells filtered by class"""
-        with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT name FROM shells
-                WHERE class = ?
-                ORDER BY name
-            ''', (shell_class,))
-            
-            shells = []
-            for row in cursor.fetchall():
-                shell_data = self.get_shell_by_name(row['name'])
-                if shell_data:
-                    shells.append(shell_data)
-            
-            return shells
+        return [
+            self._copy_shell(shell_data)
+            for shell_data in self._get_catalog().values()
+            if shell_data['class'] == shell_class
+        ]
     
     def get_shells_by_matrix_effect(self, matrix_name: str) -> List[Dict]:
         """Get shells that are compatible with a specific matrix effect"""
-        with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT DISTINCT s.name, smc.compatibility_score
-                FROM shells s
-                JOIN shell_matrix_compatibility smc ON s.id = smc.shell_id
-                JOIN matrix_effects me ON smc.matrix_id = me.id
-                WHERE me.name = ?
-                ORDER BY smc.compatibility_score DESC, s.name
-            ''', (matrix_name,))
-            
-            shells = []
-            for row in cursor.fetchall():
-                shell_data = self.get_shell_by_name(row['name'])
-                if shell_data:
-                    shell_data['compatibility_with_matrix'] = row['compatibility_score']
-                    shells.append(shell_data)
-            
-            return shells
+        compatible = [
+            shell_data for shell_data in self._get_catalog().values()
+            if matrix_name in shell_data.get('matrix_compatibility', {})
+        ]
+        compatible.sort(key=lambda shell_data: -shell_data['matrix_compatibility'][matrix_name])
+        
+        shells = []
+        for cached_shell in compatible:
+            shell_data = self._copy_shell(cached_shell)
+            shell_data['compatibility_with_matrix'] = cached_shell['matrix_compatibility'][matrix_name]
+            shells.append(shell_data)
+        
+        return shells
     
     def update_shell_stat(self, shell_name: str, stat_name: str, new_value: str) -> bool:
         """Update a specific stat value for a shell"""
@@ -278,6 +302,7 @@ class ShellManager:
             ''', (shell_name,))
             
             conn.commit()
+            self.invalidate_cache()
             print(f"Updated {shell_name} {stat_name} = {new_value}")
             return True
     
@@ -314,51 +339,34 @@ class ShellManager:
             ''', (shell_name,))
             
             conn.commit()
+            self.invalidate_cache()
             print(f"Updated {shell_name} {skill_type} skill")
             return True
     
     def get_shell_recommendations(self, matrix_effects: List[str]) -> List[Dict]:
         """Get shell recommendations based on available matrix effects"""
-        with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Build the query to find shells with compatible matrix effects
-            placeholders = ','.join('?' * len(matrix_effects))
-            
-            cursor.execute(f'''
-                SELECT 
-                    s.name as shell_name,
-                    COUNT(smc.matrix_id) as compatible_count,
-                    (
-                        SELECT COUNT(*) 
-                        FROM shell_matrix_compatibility smc2 
-                        WHERE smc2.shell_id = s.id
-                    ) as total_matrix_count,
-                    GROUP_CONCAT(me.name) as compatible_matrices
-                FROM shells s
-                JOIN shell_matrix_compatibility smc ON s.id = smc.shell_id
-                JOIN matrix_effects me ON smc.matrix_id = me.id
-                WHERE me.name IN ({placeholders})
-                GROUP BY s.id, s.name
-                ORDER BY 
-                    (CAST(compatible_count AS FLOAT) / total_matrix_count) DESC,
-                    compatible_count DESC,
-                    s.name
-            ''', matrix_effects)
-            
-            recommendations = []
-            for row in cursor.fetchall():
-                shell_data = self.get_shell_by_name(row['shell_name'])
-                if shell_data:
-                    compatibility_score = row['compatible_count'] / row['total_matrix_count']
-                    
-                    recommendation = {
-                        'shell': shell_data,
-                        'compatible_matrices': row['compatible_matrices'].split(','),
-                        'compatible_count': row['compatible_count'],
-                        'total_matrix_count': row['total_matrix_count'],
-                        'compatibility_score': compatibility_score
-                    }
-                    recommendations.append(recommendation)
-            
-            return recommendations
+        wanted = set(matrix_effects)
+        
+        recommendations = []
+        for cached_shell in self._get_catalog().values():
+            matrix_sets = cached_shell.get('sets', [])
+            compatible_matrices = [name for name in matrix_sets if name in wanted]
+            if not compatible_matrices:
+                continue
+            
+            compatible_count = len(compatible_matrices)
+            total_matrix_count = len(matrix_sets)
+            
+            recommendation = {
+                'shell': self._copy_shell(cached_shell),
+                'compatible_matrices': compatible_matrices,
+                'compatible_count': compatible_count,
+                'total_matrix_count': total_matrix_count,
+                'compatibility_score': compatible_count / total_matrix_count
+            }
+            recommendations.append(recommendation)
+        
+        # Catalog is already ordered by name, so the stable sort keeps name as the tiebreaker
+        recommendations.sort(key=lambda r: (-r['compatibility_score'], -r['compatible_count']))
+        
+        return recommendations
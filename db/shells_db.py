@@ -23,6 +23,8 @@ class ShellsDatabase:
         """Get database connection with row factory"""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # INSERT OR REPLACE deletes the old row; let it fire the aggregate delete triggers
+        conn.execute('PRAGMA recursive_triggers = ON')
         return conn
     
     def init_tables(self):
@@ -83,8 +85,86 @@ class ShellsDatabase:
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_shell_stats_shell_id ON shell_stats (shell_id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_shell_matrix_sets_shell_id ON shell_matrix_sets (shell_id)')
             
+            self._init_aggregates(cursor)
+            
             conn.commit()
     
+    def _init_aggregates(self, cursor):
+        """Create the summary counts table and the triggers that keep it in sync"""
+        # Summary counts keyed by ('total', ''), ('rarity', <rarity>), ('class', <class>)
+        # and ('matrix_set', <set name>)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS shell_aggregates (
+                key TEXT NOT NULL,
+                bucket TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (key, bucket)
+            )
+        ''')
+        
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS shells_aggregates_ai AFTER INSERT ON shells
+            BEGIN
+                INSERT INTO shell_aggregates (key, bucket, count) VALUES ('total', '', 1)
+                    ON CONFLICT (key, bucket) DO UPDATE SET count = count + 1;
+                INSERT INTO shell_aggregates (key, bucket, count) VALUES ('rarity', NEW.rarity, 1)
+                    ON CONFLICT (key, bucket) DO UPDATE SET count = count + 1;
+                INSERT INTO shell_aggregates (key, bucket, count) VALUES ('class', NEW.class, 1)
+                    ON CONFLICT (key, bucket) DO UPDATE SET count = count + 1;
+            END
+        ''')
+        
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS shells_aggregates_ad AFTER DELETE ON shells
+            BEGIN
+                UPDATE shell_aggregates SET count = count - 1 WHERE key = 'total' AND bucket = '';
+                UPDATE shell_aggregates SET count = count - 1 WHERE key = 'rarity' AND bucket = OLD.rarity;
+                UPDATE shell_aggregates SET count = count - 1 WHERE key = 'class' AND bucket = OLD.class;
+            END
+        ''')
+        
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS shells_aggregates_au AFTER UPDATE OF rarity, class ON shells
+            BEGIN
+                UPDATE shell_aggregates SET count = count - 1 WHERE key = 'rarity' AND bucket = OLD.rarity;
+                UPDATE shell_aggregates SET count = count - 1 WHERE key = 'class' AND bucket = OLD.class;
+                INSERT INTO shell_aggregates (key, bucket, count) VALUES ('rarity', NEW.rarity, 1)
+                    ON CONFLICT (key, bucket) DO UPDATE SET count = count + 1;
+                INSERT INTO shell_aggregates (key, bucket, count) VALUES ('class', NEW.class, 1)
+                    ON CONFLICT (key, bucket) DO UPDATE SET count = count + 1;
+            END
+        ''')
+        
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS shell_matrix_sets_aggregates_ai AFTER INSERT ON shell_matrix_sets
+            BEGIN
+                INSERT INTO shell_aggregates (key, bucket, count) VALUES ('matrix_set', NEW.matrix_set_name, 1)
+                    ON CONFLICT (key, bucket) DO UPDATE SET count = count + 1;
+            END
+        ''')
+        
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS shell_matrix_sets_aggregates_ad AFTER DELETE ON shell_matrix_sets
+            BEGIN
+                UPDATE shell_aggregates SET count = count - 1
+                WHERE key = 'matrix_set' AND bucket = OLD.matrix_set_name;
+            END
+        ''')
+        
+        # Backfill databases created before the aggregates table existed
+        cursor.execute('SELECT 1 FROM shell_aggregates LIMIT 1')
+        if cursor.fetchone() is None:
+            cursor.execute('''
+                INSERT INTO shell_aggregates (key, bucket, count)
+                SELECT 'total', '', COUNT(*) FROM shells
+                UNION ALL
+                SELECT 'rarity', rarity, COUNT(*) FROM shells GROUP BY rarity
+                UNION ALL
+                SELECT 'class', class, COUNT(*) FROM shells GROUP BY class
+                UNION ALL
+                SELECT 'matrix_set', matrix_set_name, COUNT(*) FROM shell_matrix_sets GROUP BY matrix_set_name
+            ''')
+    
     def clear_all_data(self):
         """Clear all shells data from the database"""
         with self.get_connection() as conn:
@@ -171,12 +251,8 @@ class ShellsDatabase:
                 ORDER BY skill_type
             ''', (shell_id,))
             
-            skills = {}
             for skill_row in cursor.fetchall():
-                skills[skill_row['skill_type']] = skill_row['skill_content']
-            
-            if skills:
-                shell_data['skills'] = skills
+                shell_data.setdefault('skills', {})[skill_row['skill_type']] = skill_row['skill_content']
             
             # Get stats
             cursor.execute('''
@@ -185,12 +261,8 @@ class ShellsDatabase:
                 ORDER BY stat_name
             ''', (shell_id,))
             
-            stats = {}
             for stat_row in cursor.fetchall():
-                stats[stat_row['stat_name']] = stat_row['stat_value']
-            
-            if stats:
-                shell_data['stats'] = stats
+                shell_data.setdefault('stats', {})[stat_row['stat_name']] = stat_row['stat_value']
             
             # Get matrix sets
             cursor.execute('''
@@ -288,36 +360,37 @@ class ShellsDatabase:
             cursor = conn.cursor()
             
             # Total count
-            cursor.execute('SELECT COUNT(*) as total FROM shells')
-            total_count = cursor.fetchone()['total']
+            cursor.execute('''
+                SELECT count FROM shell_aggregates
+                WHERE key = 'total' AND bucket = ''
+            ''')
+            total_row = cursor.fetchone()
+            total_count = total_row['count'] if total_row else 0
             
             # Count by rarity
             cursor.execute('''
-                SELECT rarity, COUNT(*) as count
-                FROM shells
-                GROUP BY rarity
+                SELECT bucket, count FROM shell_aggregates
+                WHERE key = 'rarity' AND count > 0
                 ORDER BY count DESC
             ''')
-            rarity_counts = {row['rarity']: row['count'] for row in cursor.fetchall()}
+            rarity_counts = {row['bucket']: row['count'] for row in cursor.fetchall()}
             
             # Count by class
             cursor.execute('''
-                SELECT class, COUNT(*) as count
-                FROM shells
-                GROUP BY class
+                SELECT bucket, count FROM shell_aggregates
+                WHERE key = 'class' AND count > 0
                 ORDER BY count DESC
             ''')
-            class_counts = {row['class']: row['count'] for row in cursor.fetchall()}
+            class_counts = {row['bucket']: row['count'] for row in cursor.fetchall()}
             
             # Most common matrix sets
             cursor.execute('''
-                SELECT matrix_set_name, COUNT(*) as count
-                FROM shell_matrix_sets
-                GROUP BY matrix_set_name
+                SELECT bucket, count FROM shell_aggregates
+                WHERE key = 'matrix_set' AND count > 0
                 ORDER BY count DESC
                 LIMIT 10
             ''')
-            matrix_set_counts = {row['matrix_set_name']: row['count'] for row in cursor.fetchall()}
+            matrix_set_counts = {row['bucket']: row['count'] for row in cursor.fetchall()}
             
             return {
                 'total_count': total_count,
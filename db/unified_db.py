@@ -1,16 +1,433 @@
 import sqlite3
 import json
 import os
+import threading
+import weakref
 from typing import Dict, List, Optional, Tuple, Any
 from contextlib import contextmanager
 
 
+# Applied once when the shared connection is opened
+CONNECTION_PRAGMAS = (
+    'PRAGMA foreign_keys = ON',
+    'PRAGMA journal_mode = WAL',
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA cache_size = -64000',
+    'PRAGMA mmap_size = 1073741824',
+)
+
+# Full schema, executed as one script inside a single transaction by init_tables
+SCHEMA_SQL = '''
+-- ============= CHARACTERS TABLES =============
+CREATE TABLE IF NOT EXISTS characters (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE NOT NULL,
+    rarity TEXT NOT NULL,
+    element TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS character_stats (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    character_id INTEGER NOT NULL,
+    stat_name TEXT NOT NULL,
+    total_value TEXT NOT NULL,
+    base_value TEXT NOT NULL,
+    bonus_value TEXT NOT NULL,
+    FOREIGN KEY (character_id) REFERENCES characters (id) ON DELETE CASCADE,
+    UNIQUE (character_id, stat_name)
+);
+
+CREATE TABLE IF NOT EXISTS character_skills (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    character_id INTEGER NOT NULL,
+    skill_number INTEGER NOT NULL,
+    skill_name TEXT NOT NULL,
+    skill_effect TEXT,
+    cooldown TEXT,
+    tags TEXT, -- JSON array as string
+    FOREIGN KEY (character_id) REFERENCES characters (id) ON DELETE CASCADE,
+    UNIQUE (character_id, skill_number)
+);
+
+CREATE TABLE IF NOT EXISTS character_dupes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    character_id INTEGER NOT NULL,
+    dupe_id TEXT NOT NULL, -- P1, P2, etc.
+    dupe_name TEXT NOT NULL,
+    dupe_effect TEXT NOT NULL,
+    FOREIGN KEY (character_id) REFERENCES characters (id) ON DELETE CASCADE,
+    UNIQUE (character_id, dupe_id)
+);
+
+-- Indexed copy of character_skills.tags, synced by the triggers below
+CREATE TABLE IF NOT EXISTS character_skill_tags (
+    skill_id INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (skill_id, tag),
+    FOREIGN KEY (skill_id) REFERENCES character_skills (id) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS character_skills_tags_ai AFTER INSERT ON character_skills BEGIN
+    INSERT OR IGNORE INTO character_skill_tags (skill_id, tag)
+    SELECT NEW.id, value FROM json_each(CASE WHEN json_valid(NEW.tags) THEN NEW.tags ELSE '[]' END)
+    WHERE type = 'text';
+END;
+
+CREATE TRIGGER IF NOT EXISTS character_skills_tags_au AFTER UPDATE OF tags ON character_skills BEGIN
+    DELETE FROM character_skill_tags WHERE skill_id = OLD.id;
+    INSERT OR IGNORE INTO character_skill_tags (skill_id, tag)
+    SELECT NEW.id, value FROM json_each(CASE WHEN json_valid(NEW.tags) THEN NEW.tags ELSE '[]' END)
+    WHERE type = 'text';
+END;
+
+-- Backfill tags of skills stored before the tag table existed
+INSERT OR IGNORE INTO character_skill_tags (skill_id, tag)
+SELECT s.id, t.value
+FROM character_skills s, json_each(CASE WHEN json_valid(s.tags) THEN s.tags ELSE '[]' END) t
+WHERE t.type = 'text' AND NOT EXISTS (SELECT 1 FROM character_skill_tags);
+
+-- ============= MATRIX EFFECTS TABLES =============
+CREATE TABLE IF NOT EXISTS matrix_effects (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE NOT NULL,
+    source TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS matrix_types (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    matrix_id INTEGER NOT NULL,
+    type_name TEXT NOT NULL,
+    FOREIGN KEY (matrix_id) REFERENCES matrix_effects (id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS matrix_effect_tiers (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    matrix_id INTEGER NOT NULL,
+    required_count INTEGER NOT NULL,
+    total_count INTEGER NOT NULL,
+    extra_effect TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (matrix_id) REFERENCES matrix_effects (id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS matrix_effect_stats (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    tier_id INTEGER NOT NULL,
+    stat_name TEXT NOT NULL,
+    stat_value TEXT NOT NULL,
+    FOREIGN KEY (tier_id) REFERENCES matrix_effect_tiers (id) ON DELETE CASCADE
+);
+
+-- ============= SHELLS TABLES =============
+CREATE TABLE IF NOT EXISTS shells (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE NOT NULL,
+    rarity TEXT NOT NULL,
+    class TEXT NOT NULL,
+    cooldown TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS shell_skills (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    shell_id INTEGER NOT NULL,
+    skill_type TEXT NOT NULL CHECK (skill_type IN ('awakened', 'non_awakened')),
+    skill_content TEXT NOT NULL,
+    FOREIGN KEY (shell_id) REFERENCES shells (id) ON DELETE CASCADE,
+    UNIQUE (shell_id, skill_type)
+);
+
+CREATE TABLE IF NOT EXISTS shell_stats (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    shell_id INTEGER NOT NULL,
+    stat_name TEXT NOT NULL,
+    stat_value TEXT NOT NULL,
+    FOREIGN KEY (shell_id) REFERENCES shells (id) ON DELETE CASCADE,
+    UNIQUE (shell_id, stat_name)
+);
+
+-- ============= RELATIONSHIP TABLES =============
+-- Shell-Matrix relationship (shells can use multiple matrix sets)
+CREATE TABLE IF NOT EXISTS shell_matrix_compatibility (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    shell_id INTEGER NOT NULL,
+    matrix_id INTEGER NOT NULL,
+    compatibility_score REAL DEFAULT 1.0, -- Future use for compatibility rating
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (shell_id) REFERENCES shells (id) ON DELETE CASCADE,
+    FOREIGN KEY (matrix_id) REFERENCES matrix_effects (id) ON DELETE CASCADE,
+    UNIQUE (shell_id, matrix_id)
+);
+
+-- Character-Shell relationship (characters can equip shells)
+CREATE TABLE IF NOT EXISTS character_shell_equipment (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    character_id INTEGER NOT NULL,
+    shell_id INTEGER NOT NULL,
+    equipped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_active BOOLEAN DEFAULT TRUE,
+    FOREIGN KEY (character_id) REFERENCES characters (id) ON DELETE CASCADE,
+    FOREIGN KEY (shell_id) REFERENCES shells (id) ON DELETE CASCADE
+);
+
+-- Character-Matrix relationship (characters can have matrix loadouts)
+-- Keyed by its natural key in lookup order (character, loadout, slot)
+CREATE TABLE IF NOT EXISTS character_matrix_loadouts (
+    character_id INTEGER NOT NULL,
+    matrix_id INTEGER NOT NULL,
+    position INTEGER NOT NULL, -- Matrix slot position
+    loadout_name TEXT NOT NULL DEFAULT 'Default',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_active BOOLEAN DEFAULT TRUE,
+    FOREIGN KEY (character_id) REFERENCES characters (id) ON DELETE CASCADE,
+    FOREIGN KEY (matrix_id) REFERENCES matrix_effects (id) ON DELETE CASCADE,
+    PRIMARY KEY (character_id, loadout_name, position, matrix_id)
+) WITHOUT ROWID;
+
+-- ============= COMMON LOOKUP TABLES =============
+-- Rarity definitions (shared across all entities)
+CREATE TABLE IF NOT EXISTS rarities (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE NOT NULL,
+    color_code TEXT,
+    sort_order INTEGER DEFAULT 0
+);
+
+-- Element types (for characters)
+CREATE TABLE IF NOT EXISTS elements (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE NOT NULL,
+    color_code TEXT,
+    description TEXT
+);
+
+-- Shell classes
+CREATE TABLE IF NOT EXISTS shell_classes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE NOT NULL,
+    description TEXT
+);
+
+-- Stat types (shared definitions)
+CREATE TABLE IF NOT EXISTS stat_types (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE NOT NULL,
+    display_name TEXT NOT NULL,
+    description TEXT,
+    is_percentage BOOLEAN DEFAULT FALSE
+);
+
+-- Lookup-registration triggers from an earlier version wrote rows nothing reads
+DROP TRIGGER IF EXISTS characters_lookup_ai;
+DROP TRIGGER IF EXISTS characters_lookup_au;
+DROP TRIGGER IF EXISTS shells_lookup_ai;
+DROP TRIGGER IF EXISTS shells_lookup_au;
+
+-- ============= INDEXES =============
+-- Name lookups use the UNIQUE autoindexes; drop the duplicates older versions created
+DROP INDEX IF EXISTS idx_characters_name;
+DROP INDEX IF EXISTS idx_matrix_effects_name;
+DROP INDEX IF EXISTS idx_shells_name;
+
+-- Characters
+CREATE INDEX IF NOT EXISTS idx_characters_rarity ON characters (rarity);
+CREATE INDEX IF NOT EXISTS idx_characters_element ON characters (element);
+CREATE INDEX IF NOT EXISTS idx_character_stats_character_id ON character_stats (character_id);
+CREATE INDEX IF NOT EXISTS idx_character_skills_character_id ON character_skills (character_id);
+CREATE INDEX IF NOT EXISTS idx_character_dupes_character_id ON character_dupes (character_id);
+CREATE INDEX IF NOT EXISTS idx_character_skill_tags_tag ON character_skill_tags (tag);
+
+-- Matrix Effects
+CREATE INDEX IF NOT EXISTS idx_matrix_effects_source ON matrix_effects (source);
+CREATE INDEX IF NOT EXISTS idx_matrix_types_matrix_id ON matrix_types (matrix_id);
+CREATE INDEX IF NOT EXISTS idx_matrix_tiers_matrix_id ON matrix_effect_tiers (matrix_id);
+CREATE INDEX IF NOT EXISTS idx_matrix_stats_tier_id ON matrix_effect_stats (tier_id);
+
+-- Shells
+CREATE INDEX IF NOT EXISTS idx_shells_rarity ON shells (rarity);
+CREATE INDEX IF NOT EXISTS idx_shells_class ON shells (class);
+CREATE INDEX IF NOT EXISTS idx_shell_skills_shell_id ON shell_skills (shell_id);
+CREATE INDEX IF NOT EXISTS idx_shell_stats_shell_id ON shell_stats (shell_id);
+
+-- Relationships
+CREATE INDEX IF NOT EXISTS idx_shell_matrix_shell_id ON shell_matrix_compatibility (shell_id);
+CREATE INDEX IF NOT EXISTS idx_shell_matrix_matrix_id ON shell_matrix_compatibility (matrix_id);
+CREATE INDEX IF NOT EXISTS idx_char_shell_char_id ON character_shell_equipment (character_id);
+CREATE INDEX IF NOT EXISTS idx_char_shell_shell_id ON character_shell_equipment (shell_id);
+CREATE INDEX IF NOT EXISTS idx_char_matrix_matrix_id ON character_matrix_loadouts (matrix_id);
+
+-- Active equipment/loadouts only
+CREATE INDEX IF NOT EXISTS idx_cse_active_char ON character_shell_equipment (character_id) WHERE is_active = 1;
+CREATE INDEX IF NOT EXISTS idx_cml_active_char ON character_matrix_loadouts (character_id, loadout_name, position) WHERE is_active = 1;
+'''
+
+# Typed views of the TEXT stat values ('25%', '1,234'), added as virtual
+# generated columns so SQL can filter and sort numerically while callers keep
+# reading the original strings
+NUMERIC_STAT_COLUMNS = (
+    ('character_stats', 'numeric_value',
+     "REAL GENERATED ALWAYS AS (CAST(REPLACE(REPLACE(total_value, '%', ''), ',', '') AS REAL)) VIRTUAL"),
+    ('character_stats', 'is_percentage',
+     "INTEGER GENERATED ALWAYS AS (INSTR(total_value, '%') > 0) VIRTUAL"),
+    ('matrix_effect_stats', 'numeric_value',
+     "REAL GENERATED ALWAYS AS (CAST(REPLACE(REPLACE(stat_value, '%', ''), ',', '') AS REAL)) VIRTUAL"),
+    ('matrix_effect_stats', 'is_percentage',
+     "INTEGER GENERATED ALWAYS AS (INSTR(stat_value, '%') > 0) VIRTUAL"),
+    ('shell_stats', 'numeric_value',
+     "REAL GENERATED ALWAYS AS (CAST(REPLACE(REPLACE(stat_value, '%', ''), ',', '') AS REAL)) VIRTUAL"),
+    ('shell_stats', 'is_percentage',
+     "INTEGER GENERATED ALWAYS AS (INSTR(stat_value, '%') > 0) VIRTUAL"),
+)
+
+# Builds character_full rows in get_character_by_name format; callers append
+# the WHERE clause. Subquery results are wrapped in json() because SQLite
+# drops the JSON subtype across subqueries.
+CHARACTER_PAYLOAD_SQL = '''
+    INSERT INTO character_full (character_id, payload)
+    SELECT c.id, json_object(
+        'basic_info', json_object('name', c.name, 'rarity', c.rarity, 'element', c.element),
+        'stats', json((
+            SELECT json_group_object(stat_name, json_object(
+                'total', total_value, 'base', base_value, 'bonus', bonus_value))
+            FROM (SELECT * FROM character_stats
+                  WHERE character_id = c.id ORDER BY stat_name)
+        )),
+        'skills', json((
+            SELECT json_group_array(json_object(
+                'name', skill_name, 'effect', skill_effect, 'cooldown', cooldown,
+                'tags', CASE WHEN json_valid(tags) THEN json(tags) ELSE json_array() END))
+            FROM (SELECT * FROM character_skills
+                  WHERE character_id = c.id ORDER BY skill_number)
+        )),
+        'dupes', json((
+            SELECT json_group_object(dupe_id, json_object(
+                'name', dupe_name, 'effect', dupe_effect))
+            FROM (SELECT * FROM character_dupes
+                  WHERE character_id = c.id ORDER BY dupe_id)
+        ))
+    )
+    FROM characters c'''
+
+# Trigger that rebuilds the character_full row for {row}.{column}
+CHARACTER_FULL_TRIGGER_SQL = '''
+CREATE TRIGGER IF NOT EXISTS {table}_full_{suffix} AFTER {event} ON {table} BEGIN
+    DELETE FROM character_full WHERE character_id = {row}.{column};''' + CHARACTER_PAYLOAD_SQL + '''
+    WHERE c.id = {row}.{column};
+END;
+'''
+
+# Denormalized character payloads kept in sync by triggers, so a full
+# character read is one primary-key lookup instead of four queries
+CHARACTER_FULL_SQL = '''
+-- ============= MATERIALIZED CHARACTER VIEW =============
+CREATE TABLE IF NOT EXISTS character_full (
+    character_id INTEGER PRIMARY KEY,
+    payload TEXT NOT NULL, -- JSON document
+    FOREIGN KEY (character_id) REFERENCES characters (id) ON DELETE CASCADE
+);
+''' + ''.join(
+    CHARACTER_FULL_TRIGGER_SQL.format(table=table, column=column, suffix=suffix, event=event, row=row)
+    for table, column in (
+        ('characters', 'id'),
+        ('character_stats', 'character_id'),
+        ('character_skills', 'character_id'),
+        ('character_dupes', 'character_id'),
+    )
+    for suffix, event, row in (('ai', 'INSERT', 'NEW'), ('au', 'UPDATE', 'NEW'), ('ad', 'DELETE', 'OLD'))
+    if (table, suffix) != ('characters', 'ad')
+) + '''
+-- Backfill characters stored before the view existed''' + CHARACTER_PAYLOAD_SQL + '''
+    WHERE c.id NOT IN (SELECT character_id FROM character_full);
+'''
+
+# Fixed statements issued by get_database_stats, kept as constants so the
+# text is identical on every call and served from sqlite3's statement cache
+STATS_COUNTS_SQL = '''
+    SELECT 'total_characters', COUNT(*) FROM characters
+    UNION ALL SELECT 'total_shells', COUNT(*) FROM shells
+    UNION ALL SELECT 'total_matrix_effects', COUNT(*) FROM matrix_effects
+    UNION ALL SELECT 'shell_matrix_relationships', COUNT(*) FROM shell_matrix_compatibility
+    UNION ALL SELECT 'character_shell_equipment', COUNT(*) FROM character_shell_equipment
+    UNION ALL SELECT 'character_matrix_loadouts', COUNT(*) FROM character_matrix_loadouts
+'''
+
+STATS_DISTRIBUTION_SQL = '''
+    SELECT
+        (SELECT json_group_object(rarity, count) FROM (
+            SELECT rarity, COUNT(*) AS count FROM characters GROUP BY rarity
+        )) AS characters_by_rarity,
+        (SELECT json_group_object(class, count) FROM (
+            SELECT class, COUNT(*) AS count FROM shells GROUP BY class
+        )) AS shells_by_class,
+        (SELECT json_group_object(source, count) FROM (
+            SELECT source, COUNT(*) AS count FROM matrix_effects GROUP BY source
+        )) AS matrix_by_source
+'''
+
+# Lookup rows seeded by init_tables
+INITIAL_RARITIES = [
+    ('R', '#0080ff', 0),
+    ('SR', '#8000ff', 1),
+    ('SSR', "#e7e553", 2),
+    ('Legendary', '#ff8000', 3),
+    ('Mythic', '#ff0080', 4)
+]
+
+INITIAL_ELEMENTS = [
+    ('Reason', '#ff4444', ''),
+    ('Hollow', "#44ff6d", ''),
+    ('Odd', '#4488ff', ''),
+    ('Constant', "#fff9c1", ''),
+    ('Disorder', '#8844ff', '')
+]
+
+INITIAL_SHELL_CLASSES = [
+    ('Tank', 'High defense and HP, protects team'),
+    ('DPS', 'High damage output, eliminates enemies'),
+    ('Support', 'Provides buffs and utility to team'),
+    ('Healer', 'Restores HP and provides healing'),
+    ('Striker', 'Balanced offense and utility'),
+    ('Survivor', 'High survivability with defensive abilities'),
+    ('Supporter', 'Team support and utility functions')
+]
+
+INITIAL_STAT_TYPES = [
+    ('HP', 'Health Points', 'Maximum health of the unit', False),
+    ('ATK', 'Attack', 'Physical/elemental attack power', False),
+    ('DEF', 'Defense', 'Physical damage resistance', False),
+    ('SPD', 'Speed', 'Action speed and turn order', False),
+    ('CRIT', 'Critical Rate', 'Chance to deal critical damage', True),
+    ('CRIT_DMG', 'Critical Damage', 'Critical damage multiplier', True),
+    ('Effect_RES', 'Effect Resistance', 'Resistance to debuffs', True),
+    ('Effect_ACC', 'Effect Accuracy', 'Accuracy for applying effects', True)
+]
+
+
+def _optimize_and_close(conn: sqlite3.Connection):
+    """Close a shared connection, letting SQLite refresh planner statistics gathered during the session"""
+    conn.execute('PRAGMA optimize')
+    conn.close()
+
+
 class EtheriaDatabase:
     """Unified SQLite database handler for Etheria simulation system"""
     
     def __init__(self, db_path: str = "./db/etheria.db"):
         """Initialize unified database connection and create all tables"""
         self.db_path = db_path
+        # Bumped whenever a connection writes, so in-memory caches can tell they are stale
+        self.write_generation = 0
+        # One long-lived connection shared by every operation, serialized by the lock
+        self._conn = None
+        self._conn_finalizer = None
+        self._lock = threading.RLock()
+        self._depth = 0
         self.ensure_db_directory()
         self.init_tables()
     
@@ -20,355 +437,106 @@ class EtheriaDatabase:
         if db_dir and not os.path.exists(db_dir):
             os.makedirs(db_dir)
     
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open the shared connection and apply the connection-level PRAGMAs"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections with row factory"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        # Enable foreign key constraints
-        conn.execute("PRAGMA foreign_keys = ON")
-        try:
-            yield conn
-        finally:
-            conn.close()
+        """Context manager yielding the shared database connection with row factory"""
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._open_connection()
+                # Nothing else is guaranteed to close the connection, so it is closed when this
+                # object is collected or at interpreter exit, whichever comes first
+                self._conn_finalizer = weakref.finalize(self, _optimize_and_close, self._conn)
+            conn = self._conn
+            changes_before = conn.total_changes
+            self._depth += 1
+            try:
+                yield conn
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._depth -= 1
+                if conn.total_changes != changes_before:
+                    self.write_generation += 1
+                # Uncommitted work used to be discarded when the connection closed
+                if self._depth == 0 and conn.in_transaction:
+                    conn.rollback()
+    
+    def close(self):
+        """Close the shared database connection"""
+        with self._lock:
+            if self._conn is not None:
+                # Calling the finalizer closes the connection and detaches it, so it never runs twice
+                self._conn_finalizer()
+                self._conn_finalizer = None
+                self._conn = None
     
     def init_tables(self):
         """Initialize all database tables with proper foreign key relationships"""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Enable foreign key constraints
-            cursor.execute("PRAGMA foreign_keys = ON")
-            
-            # ============= CHARACTERS TABLES =============
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS characters (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL,
-                    rarity TEXT NOT NULL,
-                    element TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
+            # Tables, indexes and lookup data are created in one transaction
+            conn.executescript('BEGIN;\n' + SCHEMA_SQL + CHARACTER_FULL_SQL)
             
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS character_stats (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    character_id INTEGER NOT NULL,
-                    stat_name TEXT NOT NULL,
-                    total_value TEXT NOT NULL,
-                    base_value TEXT NOT NULL,
-                    bonus_value TEXT NOT NULL,
-                    FOREIGN KEY (character_id) REFERENCES characters (id) ON DELETE CASCADE,
-                    UNIQUE (character_id, stat_name)
-                )
-            ''')
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS character_skills (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    character_id INTEGER NOT NULL,
-                    skill_number INTEGER NOT NULL,
-                    skill_name TEXT NOT NULL,
-                    skill_effect TEXT,
-                    cooldown TEXT,
-                    tags TEXT, -- JSON array as string
-                    FOREIGN KEY (character_id) REFERENCES characters (id) ON DELETE CASCADE,
-                    UNIQUE (character_id, skill_number)
-                )
-            ''')
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS character_dupes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    character_id INTEGER NOT NULL,
-                    dupe_id TEXT NOT NULL, -- P1, P2, etc.
-                    dupe_name TEXT NOT NULL,
-                    dupe_effect TEXT NOT NULL,
-                    FOREIGN KEY (character_id) REFERENCES characters (id) ON DELETE CASCADE,
-                    UNIQUE (character_id, dupe_id)
-                )
-            ''')
-            
-            # ============= MATRIX EFFECTS TABLES =============
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS matrix_effects (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL,
-                    source TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS matrix_types (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    matrix_id INTEGER NOT NULL,
-                    type_name TEXT NOT NULL,
-                    FOREIGN KEY (matrix_id) REFERENCES matrix_effects (id) ON DELETE CASCADE
-                )
-            ''')
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS matrix_effect_tiers (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    matrix_id INTEGER NOT NULL,
-                    required_count INTEGER NOT NULL,
-                    total_count INTEGER NOT NULL,
-                    extra_effect TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (matrix_id) REFERENCES matrix_effects (id) ON DELETE CASCADE
-                )
-            ''')
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS matrix_effect_stats (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    tier_id INTEGER NOT NULL,
-                    stat_name TEXT NOT NULL,
-                    stat_value TEXT NOT NULL,
-                    FOREIGN KEY (tier_id) REFERENCES matrix_effect_tiers (id) ON DELETE CASCADE
-                )
-            ''')
-            
-            # ============= SHELLS TABLES =============
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS shells (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL,
-                    rarity TEXT NOT NULL,
-                    class TEXT NOT NULL,
-                    cooldown TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS shell_skills (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    shell_id INTEGER NOT NULL,
-                    skill_type TEXT NOT NULL CHECK (skill_type IN ('awakened', 'non_awakened')),
-                    skill_content TEXT NOT NULL,
-                    FOREIGN KEY (shell_id) REFERENCES shells (id) ON DELETE CASCADE,
-                    UNIQUE (shell_id, skill_type)
-                )
-            ''')
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS shell_stats (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    shell_id INTEGER NOT NULL,
-                    stat_name TEXT NOT NULL,
-                    stat_value TEXT NOT NULL,
-                    FOREIGN KEY (shell_id) REFERENCES shells (id) ON DELETE CASCADE,
-                    UNIQUE (shell_id, stat_name)
-                )
-            ''')
-            
-            # ============= RELATIONSHIP TABLES =============
-            # Shell-Matrix relationship (shells can use multiple matrix sets)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS shell_matrix_compatibility (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    shell_id INTEGER NOT NULL,
-                    matrix_id INTEGER NOT NULL,
-                    compatibility_score REAL DEFAULT 1.0, -- Future use for compatibility rating
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (shell_id) REFERENCES shells (id) ON DELETE CASCADE,
-                    FOREIGN KEY (matrix_id) REFERENCES matrix_effects (id) ON DELETE CASCADE,
-                    UNIQUE (shell_id, matrix_id)
-                )
-            ''')
-            
-            # Character-Shell relationship (characters can equip shells)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS character_shell_equipment (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    character_id INTEGER NOT NULL,
-                    shell_id INTEGER NOT NULL,
-                    equipped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    is_active BOOLEAN DEFAULT TRUE,
-                    FOREIGN KEY (character_id) REFERENCES characters (id) ON DELETE CASCADE,
-                    FOREIGN KEY (shell_id) REFERENCES shells (id) ON DELETE CASCADE
-                )
-            ''')
-            
-            # Character-Matrix relationship (characters can have matrix loadouts)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS character_matrix_loadouts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    character_id INTEGER NOT NULL,
-                    matrix_id INTEGER NOT NULL,
-                    position INTEGER NOT NULL, -- Matrix slot position
-                    loadout_name TEXT DEFAULT 'Default',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    is_active BOOLEAN DEFAULT TRUE,
-                    FOREIGN KEY (character_id) REFERENCES characters (id) ON DELETE CASCADE,
-                    FOREIGN KEY (matrix_id) REFERENCES matrix_effects (id) ON DELETE CASCADE,
-                    UNIQUE (character_id, matrix_id, position, loadout_name)
-                )
-            ''')
-            
-            # ============= COMMON LOOKUP TABLES =============
-            # Rarity definitions (shared across all entities)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS rarities (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL,
-                    color_code TEXT,
-                    sort_order INTEGER DEFAULT 0
-                )
-            ''')
-            
-            # Element types (for characters)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS elements (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL,
-                    color_code TEXT,
-                    description TEXT
-                )
-            ''')
-            
-            # Shell classes
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS shell_classes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL,
-                    description TEXT
-                )
-            ''')
-            
-            # Stat types (shared definitions)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS stat_types (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL,
-                    display_name TEXT NOT NULL,
-                    description TEXT,
-                    is_percentage BOOLEAN DEFAULT FALSE
-                )
-            ''')
-            
-            # ============= INDEXES =============
-            self._create_indexes(cursor)
+            self._add_numeric_stat_columns(conn.cursor())
             
             # ============= INITIAL DATA =============
-            self._insert_initial_data(cursor)
+            self._insert_initial_data(conn.cursor())
+            
+            # Refresh planner statistics for the distribution queries
+            conn.execute('ANALYZE')
             
             conn.commit()
             print("Unified database initialized successfully")
     
-    def _create_indexes(self, cursor):
-        """Create indexes for better performance"""
-        indexes = [
-            # Characters
-            'CREATE INDEX IF NOT EXISTS idx_characters_name ON characters (name)',
-            'CREATE INDEX IF NOT EXISTS idx_characters_rarity ON characters (rarity)',
-            'CREATE INDEX IF NOT EXISTS idx_characters_element ON characters (element)',
-            'CREATE INDEX IF NOT EXISTS idx_character_stats_character_id ON character_stats (character_id)',
-            'CREATE INDEX IF NOT EXISTS idx_character_skills_character_id ON character_skills (character_id)',
-            'CREATE INDEX IF NOT EXISTS idx_character_dupes_character_id ON character_dupes (character_id)',
-            
-            # Matrix Effects
-            'CREATE INDEX IF NOT EXISTS idx_matrix_effects_name ON matrix_effects (name)',
-            'CREATE INDEX IF NOT EXISTS idx_matrix_effects_source ON matrix_effects (source)',
-            'CREATE INDEX IF NOT EXISTS idx_matrix_types_matrix_id ON matrix_types (matrix_id)',
-            'CREATE INDEX IF NOT EXISTS idx_matrix_tiers_matrix_id ON matrix_effect_tiers (matrix_id)',
-            'CREATE INDEX IF NOT EXISTS idx_matrix_stats_tier_id ON matrix_effect_stats (tier_id)',
-            
-            # Shells
-            'CREATE INDEX IF NOT EXISTS idx_shells_name ON shells (name)',
-            'CREATE INDEX IF NOT EXISTS idx_shells_rarity ON shells (rarity)',
-            'CREATE INDEX IF NOT EXISTS idx_shells_class ON shells (class)',
-            'CREATE INDEX IF NOT EXISTS idx_shell_skills_shell_id ON shell_skills (shell_id)',
-            'CREATE INDEX IF NOT EXISTS idx_shell_stats_shell_id ON shell_stats (shell_id)',
-            
-            # Relationships
-            'CREATE INDEX IF NOT EXISTS idx_shell_matrix_shell_id ON shell_matrix_compatibility (shell_id)',
-            'CREATE INDEX IF NOT EXISTS idx_shell_matrix_matrix_id ON shell_matrix_compatibility (matrix_id)',
-            'CREATE INDEX IF NOT EXISTS idx_char_shell_char_id ON character_shell_equipment (character_id)',
-            'CREATE INDEX IF NOT EXISTS idx_char_shell_shell_id ON character_shell_equipment (shell_id)',
-            'CREATE INDEX IF NOT EXISTS idx_char_matrix_char_id ON character_matrix_loadouts (character_id)',
-            'CREATE INDEX IF NOT EXISTS idx_char_matrix_matrix_id ON character_matrix_loadouts (matrix_id)',
-        ]
+    def _add_numeric_stat_columns(self, cursor):
+        """Add typed stat columns missing from tables created by older versions"""
+        for table, column, definition in NUMERIC_STAT_COLUMNS:
+            cursor.execute(f'PRAGMA table_xinfo({table})')
+            if column not in {row['name'] for row in cursor.fetchall()}:
+                cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
         
-        for index_sql in indexes:
-            cursor.execute(index_sql)
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_matrix_stats_numeric
+            ON matrix_effect_stats (stat_name, numeric_value)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_shell_stats_numeric
+            ON shell_stats (stat_name, numeric_value)
+        ''')
     
     def _insert_initial_data(self, cursor):
         """Insert initial lookup data"""
         # Insert common rarities
-        rarities = [
-            ('R', '#0080ff', 0),
-            ('SR', '#8000ff', 1),
-            ('SSR', "#e7e553", 2),
-            ('Legendary', '#ff8000', 3),
-            ('Mythic', '#ff0080', 4)
-        ]
-        
-        cursor.execute('SELECT COUNT(*) FROM rarities')
-        if cursor.fetchone()[0] == 0:
-            cursor.executemany('''
-                INSERT OR IGNORE INTO rarities (name, color_code, sort_order)
-                VALUES (?, ?, ?)
-            ''', rarities)
+        cursor.executemany('''
+            INSERT OR IGNORE INTO rarities (name, color_code, sort_order)
+            VALUES (?, ?, ?)
+        ''', INITIAL_RARITIES)
         
         # Insert common elements
-        elements = [
-            ('Reason', '#ff4444', ''),
-            ('Hollow', "#44ff6d", ''),
-            ('Odd', '#4488ff', ''),
-            ('Constant', "#fff9c1", ''),
-            ('Disorder', '#8844ff', '')
-        ]
-        
-        cursor.execute('SELECT COUNT(*) FROM elements')
-        if cursor.fetchone()[0] == 0:
-            cursor.executemany('''
-                INSERT OR IGNORE INTO elements (name, color_code, description)
-                VALUES (?, ?, ?)
-            ''', elements)
+        cursor.executemany('''
+            INSERT OR IGNORE INTO elements (name, color_code, description)
+            VALUES (?, ?, ?)
+        ''', INITIAL_ELEMENTS)
         
         # Insert shell classes
-        shell_classes = [
-            ('Tank', 'High defense and HP, protects team'),
-            ('DPS', 'High damage output, eliminates enemies'),
-            ('Support', 'Provides buffs and utility to team'),
-            ('Healer', 'Restores HP and provides healing'),
-            ('Striker', 'Balanced offense and utility'),
-            ('Survivor', 'High survivability with defensive abilities'),
-            ('Supporter', 'Team support and utility functions')
-        ]
-        
-        cursor.execute('SELECT COUNT(*) FROM shell_classes')
-        if cursor.fetchone()[0] == 0:
-            cursor.executemany('''
-                INSERT OR IGNORE INTO shell_classes (name, description)
-                VALUES (?, ?)
-            ''', shell_classes)
+        cursor.executemany('''
+            INSERT OR IGNORE INTO shell_classes (name, description)
+            VALUES (?, ?)
+        ''', INITIAL_SHELL_CLASSES)
         
         # Insert common stat types
-        stat_types = [
-            ('HP', 'Health Points', 'Maximum health of the unit', False),
-            ('ATK', 'Attack', 'Physical/elemental attack power', False),
-            ('DEF', 'Defense', 'Physical damage resistance', False),
-            ('SPD', 'Speed', 'Action speed and turn order', False),
-            ('CRIT', 'Critical Rate', 'Chance to deal critical damage', True),
-            ('CRIT_DMG', 'Critical Damage', 'Critical damage multiplier', True),
-            ('Effect_RES', 'Effect Resistance', 'Resistance to debuffs', True),
-            ('Effect_ACC', 'Effect Accuracy', 'Accuracy for applying effects', True)
-        ]
-        
-        cursor.execute('SELECT COUNT(*) FROM stat_types')
-        if cursor.fetchone()[0] == 0:
-            cursor.executemany('''
-                INSERT OR IGNORE INTO stat_types (name, display_name, description, is_percentage)
-                VALUES (?, ?, ?, ?)
-            ''', stat_types)
+        cursor.executemany('''
+            INSERT OR IGNORE INTO stat_types (name, display_name, description, is_percentage)
+            VALUES (?, ?, ?, ?)
+        ''', INITIAL_STAT_TYPES)
     
     def clear_all_data(self, confirm=False):
         """Clear all data from the database (requires confirmation)"""
@@ -377,29 +545,32 @@ class EtheriaDatabase:
             return False
         
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Clear relationship tables first (due to foreign key constraints)
-            cursor.execute('DELETE FROM character_matrix_loadouts')
-            cursor.execute('DELETE FROM character_shell_equipment')
-            cursor.execute('DELETE FROM shell_matrix_compatibility')
-            
-            # Clear detail tables
-            cursor.execute('DELETE FROM matrix_effect_stats')
-            cursor.execute('DELETE FROM matrix_effect_tiers')
-            cursor.execute('DELETE FROM matrix_types')
-            cursor.execute('DELETE FROM shell_stats')
-            cursor.execute('DELETE FROM shell_skills')
-            cursor.execute('DELETE FROM character_dupes')
-            cursor.execute('DELETE FROM character_skills')
-            cursor.execute('DELETE FROM character_stats')
-            
-            # Clear main tables
-            cursor.execute('DELETE FROM matrix_effects')
-            cursor.execute('DELETE FROM shells')
-            cursor.execute('DELETE FROM characters')
+            # One script in one transaction with foreign keys checked at COMMIT;
+            # clearing the main tables first lets the cascades empty the detail
+            # tables without rebuilding character_full payloads row by row
+            conn.executescript('''
+                BEGIN;
+                PRAGMA defer_foreign_keys = ON;
+                
+                DELETE FROM characters;
+                DELETE FROM shells;
+                DELETE FROM matrix_effects;
+                
+                DELETE FROM character_stats;
+                DELETE FROM character_skills;
+                DELETE FROM character_dupes;
+                DELETE FROM shell_skills;
+                DELETE FROM shell_stats;
+                DELETE FROM matrix_types;
+                DELETE FROM matrix_effect_tiers;
+                DELETE FROM matrix_effect_stats;
+                
+                DELETE FROM shell_matrix_compatibility;
+                DELETE FROM character_shell_equipment;
+                DELETE FROM character_matrix_loadouts;
+                COMMIT;
+            ''')
             
-            conn.commit()
             print("All data cleared successfully")
             return True
     
@@ -410,58 +581,42 @@ class EtheriaDatabase:
             
             stats = {}
             
-            # Entity counts
-            tables = ['characters', 'shells', 'matrix_effects']
-            for table in tables:
-                cursor.execute(f'SELECT COUNT(*) as count FROM {table}')
-                stats[f'total_{table}'] = cursor.fetchone()['count']
-            
-            # Relationship counts
-            cursor.execute('SELECT COUNT(*) as count FROM shell_matrix_compatibility')
-            stats['shell_matrix_relationships'] = cursor.fetchone()['count']
-            
-            cursor.execute('SELECT COUNT(*) as count FROM character_shell_equipment')
-            stats['character_shell_equipment'] = cursor.fetchone()['count']
+            # Entity and relationship counts in one round trip
+            cursor.execute(STATS_COUNTS_SQL)
+            stats.update(cursor.fetchall())
             
-            cursor.execute('SELECT COUNT(*) as count FROM character_matrix_loadouts')
-            stats['character_matrix_loadouts'] = cursor.fetchone()['count']
-            
-            # Distribution stats
-            cursor.execute('''
-                SELECT rarity, COUNT(*) as count 
-                FROM characters 
-                GROUP BY rarity 
-                ORDER BY count DESC
-            ''')
-            stats['characters_by_rarity'] = dict(cursor.fetchall())
-            
-            cursor.execute('''
-                SELECT class, COUNT(*) as count 
-                FROM shells 
-                GROUP BY class 
-                ORDER BY count DESC
-            ''')
-            stats['shells_by_class'] = dict(cursor.fetchall())
-            
-            cursor.execute('''
-                SELECT source, COUNT(*) as count 
-                FROM matrix_effects 
-                GROUP BY source 
-                ORDER BY count DESC
-            ''')
-            stats['matrix_by_source'] = dict(cursor.fetchall())
+            # Distribution stats, aggregated to JSON objects by SQLite in one row
+            # and ordered by count here (groups stream out of the index in name order)
+            cursor.execute(STATS_DISTRIBUTION_SQL)
+            row = cursor.fetchone()
+            for key in row.keys():
+                counts = json.loads(row[key])
+                stats[key] = dict(sorted(counts.items(), key=lambda item: -item[1]))
             
             return stats
     
-    def execute_query(self, query: str, params: Tuple = ()) -> List[Dict]:
-        """Execute a custom query and return results"""
+    def bulk_insert(self, table: str, rows: List[Dict]) -> int:
+        """Insert many rows into a table with one prepared statement and one commit"""
+        if not rows:
+            return 0
+        
+        columns = list(rows[0].keys())
+        query = f'INSERT INTO {table} ({", ".join(columns)}) VALUES ({", ".join("?" * len(columns))})'
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(query, [tuple(row[column] for column in columns) for row in rows])
+            conn.commit()
+            return len(rows)
+    
+    def execute_query(self, query: str, params: Tuple = (), *, as_dict: bool = True) -> List[Any]:
+        """Execute a custom query and return results (sqlite3.Row objects when as_dict is False)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
             
-            # Convert rows to dictionaries
-            results = []
-            for row in cursor.fetchall():
-                results.append(dict(row))
+            if not as_dict:
+                return cursor.fetchall()
             
-            return results
+            # Convert rows to dictionaries
+            return [dict(row) for row in cursor.fetchall()]
@@ -1,6 +1,9 @@
 import os
 import sys
+import glob
+from concurrent.futures import ProcessPoolExecutor
 from bs4 import BeautifulSoup
+import soupsieve
 import re
 import json
 
@@ -17,11 +20,59 @@ except ImportError as e:
     print("Running in JSON-only mode")
     DATABASE_AVAILABLE = False
 
+# Serialize JSON in C when orjson is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libxml2-backed tree builder when lxml is installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Patterns used on every stat row, skill and prowess, compiled once
+_BREAKDOWN_RE = re.compile(r'(\d+(?:,\d+)*)\s*\+\s*(\d+(?:,\d+)*)')
+_SINGLE_NUM_RE = re.compile(r'(\d+(?:,\d+)*)')
+_PCT_BREAKDOWN_RE = re.compile(r'(\d+(?:\.\d+)?)%\s*\+\s*(\d+(?:\.\d+)?)%')
+_PCT_SINGLE_RE = re.compile(r'(\d+(?:\.\d+)?)%')
+_STATS_CLS_RE = re.compile('stats|info-list-row')
+_WS_RE = re.compile(r'\s+')
+_ELEMENT_RE = re.compile(r'\b(Disorder|Reason|Hollow|Odd|Constant)\b')
+
+# CSS selectors, compiled once
+_RARITY_SEL = soupsieve.compile('.rarity-SSR, .rarity-SR, .rarity-R')
+_SECTION_SEL = soupsieve.compile('div.skills, div.eidolons')
+_SKILL_BOX_SEL = soupsieve.compile('div.skills div.box, div.eidolons div.box')
+_EIDOLON_BOX_SEL = soupsieve.compile('div.eidolons div.box')
+_SKILL_HEADER_SEL = soupsieve.compile('div.skill-header')
+_SKILL_ICON_SEL = soupsieve.compile('div.skill-icon')
+_SKILL_NAME_SEL = soupsieve.compile('div.skill-info p.skill-name')
+_SKILL_DESC_SEL = soupsieve.compile('div.skill-description')
+_ADD_INFO_SEL = soupsieve.compile('div.additional-information')
+
+# Stats whose values are flat numbers vs. percentages
+_INT_STATS = {'HP', 'DEF', 'ATK', 'SPD'}
+_PCT_STATS = {'CRIT Rate', 'CRIT DMG', 'Effect ACC', 'Effect RES'}
+# Substring match order for labels that are not exactly a stat name
+_STAT_SCAN_ORDER = ('HP', 'DEF', 'ATK', 'SPD', 'CRIT Rate', 'CRIT DMG', 'Effect ACC', 'Effect RES')
+
+
+def _is_plain_decimal(text):
+    """Check that text is an ASCII number like '12' or '12.5'"""
+    whole, dot, frac = text.partition('.')
+    return (whole.isascii() and whole.isdigit()
+            and (not dot or (frac.isascii() and frac.isdigit())))
+
 
 class CharacterParser:
-    def __init__(self, html_file_path, use_database=True, db_path="./db/etheria.db"):
+    def __init__(self, html_file_path, use_database=True, db_path="./db/etheria.db", verbose=False):
         """Initialize parser with HTML file path as parameter"""
         self.html_file = html_file_path
+        # Progress messages are only printed when verbose, keeping batch runs quiet
+        self.verbose = verbose
         self.soup = None
         self.data = {}
         self.character_data = {}
@@ -36,10 +87,12 @@ class CharacterParser:
     def load_html(self):
         """Load the HTML file"""
         try:
-            with open(self.html_file, 'r', encoding='utf-8') as file:
+            # Hand the raw bytes to the parser; it decodes them natively
+            with open(self.html_file, 'rb') as file:
                 content = file.read()
-                self.soup = BeautifulSoup(content, 'html.parser')
-                print(f"HTML file loaded successfully")
+                self.soup = BeautifulSoup(content, HTML_PARSER, from_encoding='utf-8')
+                if self.verbose:
+                    print(f"HTML file loaded successfully")
         except Exception as e:
             print(f"Error loading HTML file: {e}")
             return False
@@ -51,11 +104,13 @@ class CharacterParser:
         
         try:
             # Extract character name from breadcrumb or h1
-            name_candidates = [
-                self.soup.find('ul', class_='breadcrumb'),
-                self.soup.find('h1'),
-                self.soup.find('strong', class_='rarity-SSR')
-            ]
+            # Looked up lazily so later candidates are not searched once a name is found
+            name_candidates = (
+                self.soup.find(tag_name, **attrs)
+                for tag_name, attrs in (('ul', {'class_': 'breadcrumb'}),
+                                        ('h1', {}),
+                                        ('strong', {'class_': 'rarity-SSR'}))
+            )
             
             character_name = None
             for candidate in name_candidates:
@@ -74,7 +129,7 @@ class CharacterParser:
             basic_info['name'] = character_name or 'Unknown'
             
             # Extract rarity from CSS classes
-            rarity_element = self.soup.find(class_=re.compile(r'rarity-(SSR|SR|R)'))
+            rarity_element = _RARITY_SEL.select_one(self.soup)
             if rarity_element:
                 class_list = rarity_element.get('class', [])
                 for cls in class_list:
@@ -95,17 +150,20 @@ class CharacterParser:
                     element_found = pattern
                     break
             
-            # If not found, search in text content
+            # If not found, scan the page strings without joining them and keep the pattern priority order
             if not element_found:
-                text_content = self.soup.get_text()
-                for pattern in element_patterns:
-                    if pattern in text_content:
-                        element_found = pattern
+                mentioned = set()
+                for text in self.soup.strings:
+                    mentioned.update(_ELEMENT_RE.findall(text))
+                    # Nothing outranks the first pattern, so stop once it is seen
+                    if element_patterns[0] in mentioned:
                         break
+                element_found = next((pattern for pattern in element_patterns if pattern in mentioned), None)
             
             basic_info['element'] = element_found or 'Unknown'
             
-            print(f"Basic info extracted - Name: {basic_info['name']}, Rarity: {basic_info['rarity']}, Element: {basic_info['element']}")
+            if self.verbose:
+                print(f"Basic info extracted - Name: {basic_info['name']}, Rarity: {basic_info['rarity']}, Element: {basic_info['element']}")
             
         except Exception as e:
             print(f"Error extracting basic info: {e}")
@@ -118,7 +176,7 @@ class CharacterParser:
         stats = {}
         
         # Find stats section in the HTML
-        stats_sections = self.soup.find_all(['div'], class_=re.compile('stats|info-list-row'))
+        stats_sections = self.soup.find_all(['div'], class_=_STATS_CLS_RE)
         
         # Extract stats from the structured data
         for section in stats_sections:
@@ -138,58 +196,27 @@ class CharacterParser:
                     total_value = bigger_value.get_text(strip=True)
                     breakdown_text = smaller_value.get_text(strip=True)
                     
-                    # Parse breakdown format: "base + bonus"
-                    base_value, bonus_value = self._parse_stat_breakdown(breakdown_text)
+                    # Resolve the stat name, falling back to a substring scan for decorated labels
+                    stat_name = stat_text.rstrip(':').strip()
+                    if stat_name not in _INT_STATS and stat_name not in _PCT_STATS:
+                        stat_name = next((name for name in _STAT_SCAN_ORDER if name in stat_text), None)
                     
                     # Store stat information
-                    if 'HP' in stat_text:
-                        stats['HP'] = {
+                    if stat_name in _INT_STATS:
+                        # Parse breakdown format: "base + bonus"
+                        base_value, bonus_value = self._parse_stat_breakdown(breakdown_text)
+                        stats[stat_name] = {
                             'total': self._extract_number(total_value),
                             'base': base_value,
                             'bonus': bonus_value
                         }
-                    elif 'DEF' in stat_text:
-                        stats['DEF'] = {
-                            'total': self._extract_number(total_value),
-                            'base': base_value,
-                            'bonus': bonus_value
-                        }
-                    elif 'ATK' in stat_text:
-                        stats['ATK'] = {
-                            'total': self._extract_number(total_value),
-                            'base': base_value,
-                            'bonus': bonus_value
-                        }
-                    elif 'SPD' in stat_text:
-                        stats['SPD'] = {
-                            'total': self._extract_number(total_value),
+                    elif stat_name in _PCT_STATS:
+                        base_value, bonus_value = self._extract_percentage_breakdown(breakdown_text)
+                        stats[stat_name] = {
+                            'total': total_value,
                             'base': base_value,
                             'bonus': bonus_value
                         }
-                    elif 'CRIT Rate' in stat_text:
-                        stats['CRIT Rate'] = {
-                            'total': total_value,
-                            'base': self._extract_percentage_breakdown(breakdown_text)[0],
-                            'bonus': self._extract_percentage_breakdown(breakdown_text)[1]
-                        }
-                    elif 'CRIT DMG' in stat_text:
-                        stats['CRIT DMG'] = {
-                            'total': total_value,
-                            'base': self._extract_percentage_breakdown(breakdown_text)[0],
-                            'bonus': self._extract_percentage_breakdown(breakdown_text)[1]
-                        }
-                    elif 'Effect ACC' in stat_text:
-                        stats['Effect ACC'] = {
-                            'total': total_value,
-                            'base': self._extract_percentage_breakdown(breakdown_text)[0],
-                            'bonus': self._extract_percentage_breakdown(breakdown_text)[1]
-                        }
-                    elif 'Effect RES' in stat_text:
-                        stats['Effect RES'] = {
-                            'total': total_value,
-                            'base': self._extract_percentage_breakdown(breakdown_text)[0],
-                            'bonus': self._extract_percentage_breakdown(breakdown_text)[1]
-                        }
         
         self.character_data['stats'] = stats
         return stats
@@ -199,26 +226,47 @@ class CharacterParser:
         if not text:
             return 0
         
-        # Remove commas and extract digits
-        numbers = re.findall(r'[\d,]+', str(text))
-        if numbers:
-            return int(numbers[0].replace(',', ''))
-        return 0
+        text = str(text)
+        
+        # Common case: the whole text is a comma-formatted number
+        digits = text.replace(',', '')
+        if digits.isascii() and digits.isdigit():
+            return int(digits)
+        
+        # Otherwise scan to the first run of digits (and commas)
+        length = len(text)
+        start = 0
+        while start < length and not '0' <= text[start] <= '9':
+            start += 1
+        if start == length:
+            return 0
+        end = start
+        while end < length and ('0' <= text[end] <= '9' or text[end] == ','):
+            end += 1
+        return int(text[start:end].replace(',', ''))
     
     def _parse_stat_breakdown(self, breakdown_text):
         """Parse stat breakdown format: 'base + bonus'"""
         if not breakdown_text:
             return None, None
         
+        # Fast path for the usual plain "12669 + 5417" text
+        left, sep, right = breakdown_text.partition(' + ')
+        if sep:
+            left = left.strip().replace(',', '')
+            right = right.strip().replace(',', '')
+            if left.isascii() and left.isdigit() and right.isascii() and right.isdigit():
+                return int(left), int(right)
+        
         # Look for pattern like "12669 + 5417"
-        match = re.search(r'(\d+(?:,\d+)*)\s*\+\s*(\d+(?:,\d+)*)', breakdown_text)
+        match = _BREAKDOWN_RE.search(breakdown_text)
         if match:
             base = int(match.group(1).replace(',', ''))
             bonus = int(match.group(2).replace(',', ''))
             return base, bonus
         
         # If no breakdown found, try to extract single value as base
-        single_match = re.search(r'(\d+(?:,\d+)*)', breakdown_text)
+        single_match = _SINGLE_NUM_RE.search(breakdown_text)
         if single_match:
             base = int(single_match.group(1).replace(',', ''))
             return base, 0
@@ -230,15 +278,23 @@ class CharacterParser:
         if not breakdown_text:
             return None, None
         
+        # Fast path for the usual plain "10% + 22%" text
+        left, sep, right = breakdown_text.partition('% + ')
+        if sep:
+            left = left.strip()
+            right = right.strip()
+            if right.endswith('%') and _is_plain_decimal(left) and _is_plain_decimal(right[:-1]):
+                return left + '%', right
+        
         # Look for pattern like "10% + 22%"
-        match = re.search(r'(\d+(?:\.\d+)?)%\s*\+\s*(\d+(?:\.\d+)?)%', breakdown_text)
+        match = _PCT_BREAKDOWN_RE.search(breakdown_text)
         if match:
             base = match.group(1) + '%'
             bonus = match.group(2) + '%'
             return base, bonus
         
         # If no breakdown found, try to extract single percentage as base
-        single_match = re.search(r'(\d+(?:\.\d+)?)%', breakdown_text)
+        single_match = _PCT_SINGLE_RE.search(breakdown_text)
         if single_match:
             base = single_match.group(1) + '%'
             return base, '0%'
@@ -247,160 +303,144 @@ class CharacterParser:
     
     def extract_skills(self):
         """Extract character skills information"""
+        return self._extract_skills_and_dupes()[0]
+    
+    def extract_dupes(self):
+        """Extract Prowess (P1-P5) information"""
+        return self._extract_skills_and_dupes()[1]
+    
+    def _extract_skills_and_dupes(self):
+        """Extract skills and Prowess (P1-P5) in a single pass over the boxes"""
         skills = []
+        dupes = {}
         
-        # Find skill boxes in the HTML - look specifically in skills section, not eidolons
-        skills_section = self.soup.find(['div'], class_='skills')
-        if not skills_section:
+        # Pages without skill or eidolon sections have nothing to walk
+        if not _SECTION_SEL.select_one(self.soup):
             self.character_data['skills'] = skills
-            return skills
-        
-        skill_boxes = skills_section.find_all(['div'], class_='box')
-        
-        for skill_box in skill_boxes:
-            # Check if this box contains skill information
-            skill_header = skill_box.find(['div'], class_='skill-header')
-            if skill_header:
-                # Skip if this is a prowess/eidolon (has "with-border" class or P1-P5 in icon)
-                if 'with-border' in skill_header.get('class', []):
-                    continue
-                
-                skill_icon = skill_header.find(['div'], class_='skill-icon')
-                if skill_icon:
-                    icon_text = skill_icon.get_text(strip=True)
-                    if icon_text.startswith('P') and icon_text[1:].isdigit():
-                        continue  # Skip prowess skills
-                
-                skill_data = {}
-                
-                # Extract skill name from skill-info
-                skill_info = skill_header.find(['div'], class_='skill-info')
-                if skill_info:
-                    name_elem = skill_info.find(['p'], class_='skill-name')
-                    if name_elem:
-                        skill_data['name'] = name_elem.get_text(strip=True)
-                
-                # Extract skill description/effect
-                desc_elem = skill_box.find(['div'], class_='skill-description')
-                if desc_elem:
-                    # Get all paragraph text and clean it
-                    paragraphs = desc_elem.find_all(['p'])
-                    if paragraphs:
-                        effect_text = ' '.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
-                        # Clean HTML tags and normalize whitespace
-                        effect_text = re.sub(r'<[^>]+>', '', effect_text)
-                        effect_text = re.sub(r'\s+', ' ', effect_text).strip()
-                        if effect_text:
-                            skill_data['effect'] = effect_text
-                
-                # Extract cooldown and tags from additional-information
-                add_info = skill_box.find(['div'], class_='additional-information')
-                if add_info:
-                    # Extract all p elements
-                    paragraphs = add_info.find_all(['p'])
-                    
-                    for p in paragraphs:
-                        p_text = p.get_text(strip=True)
-                        
-                        # Check for cooldown
-                        if 'Cooldown:' in p_text:
-                            span = p.find(['span'])
-                            if span:
-                                cooldown_text = span.get_text(strip=True)
-                                if cooldown_text and cooldown_text != '-':
-                                    try:
-                                        skill_data['cooldown'] = int(cooldown_text)
-                                    except ValueError:
-                                        if cooldown_text == '0':
-                                            skill_data['cooldown'] = 0
-                        
-                        # Check for tags
-                        elif 'Tags:' in p_text:
-                            span = p.find(['span'])
-                            if span:
-                                tags_text = span.get_text(strip=True)
-                                if tags_text:
-                                    tags = [tag.strip() for tag in tags_text.split(',') if tag.strip()]
-                                    if tags:
-                                        skill_data['tags'] = tags
-                
+            self.character_data['dupes'] = dupes
+            return skills, dupes
+        
+        # Walk every skill and eidolon box once, in document order
+        for box in _SKILL_BOX_SEL.select(self.soup):
+            skill_header = _SKILL_HEADER_SEL.select_one(box)
+            if not skill_header:
+                continue
+            
+            in_eidolons = _EIDOLON_BOX_SEL.match(box)
+            skill_icon = _SKILL_ICON_SEL.select_one(skill_header)
+            icon_text = skill_icon.get_text(strip=True) if skill_icon else ''
+            
+            if icon_text.startswith('P') and icon_text[1:].isdigit():
+                if in_eidolons:
+                    dupes[icon_text] = self._build_dupe(box, skill_header, icon_text[1:])
+            # Skip prowess/eidolon boxes (with-border header or eidolons section)
+            elif not in_eidolons and 'with-border' not in skill_header.get('class', []):
+                skill_data = self._build_skill(box, skill_header)
                 # Only add skill if it has at least a name
                 if skill_data.get('name'):
                     skills.append(skill_data)
         
         self.character_data['skills'] = skills
-        return skills
+        self.character_data['dupes'] = dupes
+        return skills, dupes
     
-    def extract_dupes(self):
-        """Extract Prowess (P1-P5) information"""
-        dupes = {}
-        
-        # Look for eidolons/prowess sections
-        eidolon_sections = self.soup.find_all(['div'], class_='eidolons')
-        
-        for section in eidolon_sections:
-            # Find all boxes within eidolons section
-            boxes = section.find_all(['div'], class_='box')
+    def _build_skill(self, skill_box, skill_header):
+        """Build a skill entry from a skill box"""
+        skill_data = {}
+        
+        # Extract skill name from skill-info
+        name_elem = _SKILL_NAME_SEL.select_one(skill_header)
+        if name_elem:
+            skill_data['name'] = name_elem.get_text(strip=True)
+        
+        # Extract skill description/effect
+        desc_elem = _SKILL_DESC_SEL.select_one(skill_box)
+        if desc_elem:
+            # Get all paragraph text and clean it
+            paragraphs = desc_elem.find_all(['p'])
+            if paragraphs:
+                effect_text = ' '.join(text for p in paragraphs if (text := p.get_text(strip=True)))
+                # Normalize whitespace (get_text already dropped the markup)
+                effect_text = _WS_RE.sub(' ', effect_text).strip()
+                if effect_text:
+                    skill_data['effect'] = effect_text
+        
+        # Extract cooldown and tags from additional-information
+        add_info = _ADD_INFO_SEL.select_one(skill_box)
+        if add_info:
+            # Extract all p elements
+            paragraphs = add_info.find_all(['p'])
             
-            for box in boxes:
-                # Get skill header
-                skill_header = box.find(['div'], class_='skill-header')
-                if skill_header:
-                    # Extract prowess number from skill icon
-                    skill_icon = skill_header.find(['div'], class_='skill-icon')
-                    if skill_icon:
-                        icon_text = skill_icon.get_text(strip=True)
-                        if icon_text.startswith('P') and icon_text[1:].isdigit():
-                            prowess_num = icon_text[1:]
-                            
-                            # Extract skill name
-                            skill_info = skill_header.find(['div'], class_='skill-info')
-                            skill_name = skill_info.find(['p'], class_='skill-name').get_text(strip=True) if skill_info else f'Prowess {prowess_num}'
-                            
-                            # Extract skill description
-                            skill_desc = box.find(['div'], class_='skill-description')
-                            effect = skill_desc.get_text(strip=True) if skill_desc else None
-                            
-                            # Clean up effect text
-                            if effect:
-                                effect = re.sub(r'<[^>]+>', '', effect)
-                                effect = re.sub(r'\s+', ' ', effect).strip()
-                            
-                            dupes[f'P{prowess_num}'] = {
-                                'name': skill_name,
-                                'effect': effect
-                            }
-        
-
+            for p in paragraphs:
+                # "Label: <span>value</span>" - the stripped text already holds the span value
+                label, sep, value = p.get_text(strip=True).partition(':')
+                if not sep or not value:
+                    continue
+                
+                # Check for cooldown
+                if label == 'Cooldown':
+                    if value != '-':
+                        try:
+                            skill_data['cooldown'] = int(value)
+                        except ValueError:
+                            pass
+                
+                # Check for tags
+                elif label == 'Tags':
+                    tags = [tag.strip() for tag in value.split(',') if tag.strip()]
+                    if tags:
+                        skill_data['tags'] = tags
         
-        self.character_data['dupes'] = dupes
-        return dupes
+        return skill_data
+    
+    def _build_dupe(self, box, skill_header, prowess_num):
+        """Build a Prowess entry from an eidolon box"""
+        # Extract skill name
+        name_elem = _SKILL_NAME_SEL.select_one(skill_header)
+        skill_name = name_elem.get_text(strip=True) if name_elem else f'Prowess {prowess_num}'
+        
+        # Extract skill description
+        skill_desc = _SKILL_DESC_SEL.select_one(box)
+        effect = skill_desc.get_text(strip=True) if skill_desc else None
+        
+        # Normalize whitespace (get_text already dropped the markup)
+        if effect:
+            effect = _WS_RE.sub(' ', effect).strip()
+        
+        return {
+            'name': skill_name,
+            'effect': effect
+        }
     
     def parse_all(self):
         """Parse all character information"""
         if not self.load_html():
             return None
         
-        print("Extracting basic info...")
+        if self.verbose:
+            print("Extracting basic info...")
         basic_info = self.extract_basic_info()
         self.character_data['basic_info'] = basic_info
             
-        print("Extracting base stats...")
+        if self.verbose:
+            print("Extracting base stats...")
         self.extract_base_stats()
         
-        print("Extracting skills...")
-        self.extract_skills()
-        
-        print("Extracting dupes...")
-        self.extract_dupes()
+        if self.verbose:
+            print("Extracting skills and dupes...")
+        self._extract_skills_and_dupes()
         
         return self.character_data
     
     def save_to_json(self, output_file):
         """Save parsed data to JSON file"""
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(self.character_data, f, indent=2, ensure_ascii=False)
+            if orjson:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(self.character_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.character_data, f, indent=2, ensure_ascii=False)
             print(f"Data saved to: {output_file}")
             return True
         except Exception as e:
@@ -501,23 +541,50 @@ class CharacterParser:
             print("No prowess information found")
 
 
+def _parse_one(html_file):
+    """Parse one character file and write its JSON next to it (batch worker)"""
+    parser = CharacterParser(html_file, use_database=False)
+    if not parser.parse_all():
+        return False
+    return parser.save_to_json(html_file.replace('.html', '_data.json'))
+
+
+def parse_batch(html_files, max_workers=None):
+    """Parse many character files in parallel, one process per worker"""
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_parse_one, html_files))
+    
+    success_count = sum(1 for ok in results if ok)
+    print(f"Successfully parsed {success_count}/{len(html_files)} characters")
+    return success_count
+
+
 def main():
     # Check command line arguments
     if len(sys.argv) < 2:
-        print("Usage: python parse_char.py <html_file_path>")
+        print("Usage: python parse_char.py <html_file_path> [<html_file_path> ...]")
         print("Example: python parse_char.py ./var/character/Plume.html")
         return
     
-    # Get HTML file path from command line argument
-    html_file = sys.argv[1]
+    # Expand any glob patterns the shell did not
+    html_files = [path for arg in sys.argv[1:] for path in (sorted(glob.glob(arg)) or [arg])]
+    
+    # Check if files exist
+    missing = [path for path in html_files if not os.path.exists(path)]
+    if missing:
+        for path in missing:
+            print(f"Error: HTML file not found at {path}")
+        return
     
-    # Check if file exists
-    if not os.path.exists(html_file):
-        print(f"Error: HTML file not found at {html_file}")
+    # Several files are parsed in parallel without the per-file summary
+    if len(html_files) > 1:
+        parse_batch(html_files)
         return
     
+    html_file = html_files[0]
+    
     # Create parser instance with HTML file path
-    parser = CharacterParser(html_file)
+    parser = CharacterParser(html_file, verbose=True)
     
     # Parse the HTML file
     data = parser.parse_all()
@@ -534,4 +601,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
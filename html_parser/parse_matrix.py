@@ -1,6 +1,7 @@
 import os
 import sys
-from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 import json
 
@@ -17,6 +18,59 @@ except ImportError as e:
     print("Running in JSON-only mode")
     DATABASE_AVAILABLE = False
 
+# Serialize JSON in C when orjson is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libxml2-backed tree builder when lxml is installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Only the matrix boxes (and everything inside them) are kept in the tree;
+# same class string extract_matrix_effects matches on
+_MATRIX_BOX_STRAINER = SoupStrainer('div', class_='etheria-matrix-box box')
+
+# Stat bonus patterns recognised in matrix effect text, combined into one
+# alternation; each alternative captures its value in a group named after the stat.
+# The stat names below are the only key objects ever stored in effect dicts
+_STAT_GROUPS = {
+    'ATK': 'ATK',
+    'DEF': 'DEF',
+    'HP': 'HP',
+    'SPD': 'SPD',
+    'CRIT_Rate': 'CRIT Rate',
+    'CRIT_DMG': 'CRIT DMG',
+    'Effect_RES': 'Effect RES',
+    'Effect_ACC': 'Effect ACC',
+    'Healing_Effect': 'Healing Effect'
+}
+# Written in upper case and matched against upper-cased text, which is much
+# cheaper than case-insensitive matching
+_STATS_RE = re.compile('|'.join([
+    r'ATK\s*\+(?P<ATK>\d+)%',
+    r'DEF\s*\+(?P<DEF>\d+)%',
+    r'HP\s*\+(?P<HP>\d+)%',
+    r'SPD\s*\+(?P<SPD>\d+)%',
+    r'CRIT RATE\s*\+(?P<CRIT_Rate>\d+)%',
+    r'CRIT DMG\s*\+(?P<CRIT_DMG>\d+)%',
+    r'EFFECT RES\s*\+(?P<Effect_RES>\d+)%',
+    r'EFFECT ACC\s*\+(?P<Effect_ACC>\d+)%',
+    r'HEALING EFFECT\s*(?:INCREASES BY\s*)?(?P<Healing_Effect>\d+)%'
+]))
+# For the rare text whose length changes when upper-cased (e.g. 'ß' -> 'SS')
+_STATS_CI_RE = re.compile(_STATS_RE.pattern, re.IGNORECASE)
+
+# '&' separators (with their surrounding whitespace) or any whitespace run
+_SEPARATOR_RE = re.compile(r'(?:\s*&)+\s*|\s+')
+_WS_RE = re.compile(r'\s+')
+_MATRIX_EFFECT_RE = re.compile(r'(\d+)/(\d+):\s*(.+)')
+_BRACKET_RE = re.compile(r'\s*\[.*?\]')
+
 
 class MatrixEffectsParser:
     def __init__(self, html_file_path, use_database=True, db_path="./db/etheria.db"):
@@ -39,49 +93,41 @@ class MatrixEffectsParser:
             'extra_effect': ''
         }
         
-        # Common stat patterns
-        stat_patterns = [
-            (r'ATK\s*\+(\d+)%', 'ATK'),
-            (r'DEF\s*\+(\d+)%', 'DEF'),
-            (r'HP\s*\+(\d+)%', 'HP'),
-            (r'SPD\s*\+(\d+)%', 'SPD'),
-            (r'CRIT Rate\s*\+(\d+)%', 'CRIT Rate'),
-            (r'CRIT DMG\s*\+(\d+)%', 'CRIT DMG'),
-            (r'Effect RES\s*\+(\d+)%', 'Effect RES'),
-            (r'Effect ACC\s*\+(\d+)%', 'Effect ACC'),
-            (r'Healing Effect\s*(?:increases by\s*)?(\d+)%', 'Healing Effect')
-        ]
+        # Extract stat bonuses and remove them from the text in one pass;
+        # "DEF +25% & Effect RES +20%" is handled the same way
+        found = {}
+        
+        def take_stat(match):
+            # Keep the first value seen for each stat
+            found.setdefault(match.lastgroup, f"{match.group(match.lastgroup)}%")
+            return ''
         
-        # Extract stat bonuses
-        remaining_text = effect_text
-        for pattern, stat_name in stat_patterns:
-            matches = re.findall(pattern, remaining_text, re.IGNORECASE)
-            if matches:
-                # Take the first match and convert to int
-                effect_data['effect'][stat_name] = f"{matches[0]}%"
-                # Remove the matched text from remaining text
-                remaining_text = re.sub(pattern, '', remaining_text, flags=re.IGNORECASE)
+        # Upper-case once and cut the matched spans out of the original text
+        scan_text = effect_text.upper()
+        if len(scan_text) == len(effect_text):
+            pieces = []
+            last_end = 0
+            for match in _STATS_RE.finditer(scan_text):
+                take_stat(match)
+                pieces.append(effect_text[last_end:match.start()])
+                last_end = match.end()
+            pieces.append(effect_text[last_end:])
+            remaining_text = ''.join(pieces)
+        else:
+            remaining_text = _STATS_CI_RE.sub(take_stat, effect_text)
         
-        # Handle combined stats with &
-        # Example: "DEF +25% & Effect RES +20%"
-        if '&' in effect_text:
-            parts = effect_text.split('&')
-            for part in parts:
-                part = part.strip()
-                for pattern, stat_name in stat_patterns:
-                    match = re.search(pattern, part, re.IGNORECASE)
-                    if match:
-                        effect_data['effect'][stat_name] = f"{match.group(1)}%"
+        # Report stats in the fixed pattern order rather than text order
+        effect_data['effect'] = {
+            stat_name: found[group] for group, stat_name in _STAT_GROUPS.items() if group in found
+        }
         
-        # Clean up remaining text for extra effects
-        # Remove multiple spaces, leading/trailing dots and spaces
-        remaining_text = re.sub(r'\s*&\s*', ' ', remaining_text)
-        remaining_text = re.sub(r'^\.\s*', '', remaining_text)
-        remaining_text = re.sub(r'\s+', ' ', remaining_text).strip()
-        remaining_text = remaining_text.strip(' .')
+        # Clean up remaining text for extra effects in one substitution:
+        # '&' separators and whitespace runs become single spaces, then
+        # leading/trailing dots and spaces go (including a ". " left by a removed stat)
+        remaining_text = _SEPARATOR_RE.sub(' ', remaining_text).strip(' .')
         
         # If there's meaningful text left, it's an extra effect
-        if remaining_text and len(remaining_text) > 10:  # Avoid very short meaningless text
+        if len(remaining_text) > 10:  # Avoid empty or very short meaningless text
             effect_data['extra_effect'] = remaining_text
         
         return effect_data
@@ -89,9 +135,10 @@ class MatrixEffectsParser:
     def load_html(self):
         """Load the HTML file"""
         try:
-            with open(self.html_file, 'r', encoding='utf-8') as file:
+            # Hand the raw bytes to the parser; it decodes them natively
+            with open(self.html_file, 'rb') as file:
                 content = file.read()
-                self.soup = BeautifulSoup(content, 'html.parser')
+                self.soup = BeautifulSoup(content, HTML_PARSER, from_encoding='utf-8', parse_only=_MATRIX_BOX_STRAINER)
                 print(f"HTML file loaded successfully")
         except Exception as e:
             print(f"Error loading HTML file: {e}")
@@ -104,85 +151,57 @@ class MatrixEffectsParser:
         seen_names = set()  # To avoid duplicates
         
         try:
-            # Find all matrix containers - use more specific selector to avoid duplicates
+            # Find all matrix containers - use more specific selector to avoid duplicates.
+            # The strainer has already cut the page down to the boxes, so this search is cheap,
+            # but it must still descend: a box nested in another box is not a top-level node
             matrix_containers = self.soup.find_all('div', class_='etheria-matrix-box box')
             
             for container in matrix_containers:
-                matrix_data = {}
+                name_element, info_element, content_element = self._find_matrix_parts(container)
                 
                 # Extract matrix name
-                name_element = container.find('h4')
-                if name_element:
-                    # Remove any span tags (like [INFERNO ONLY])
-                    name_text = name_element.get_text().strip()
-                    # Clean up the name by removing special indicators
-                    matrix_data['name'] = re.sub(r'\s*\[.*?\]', '', name_text).strip()
+                if not name_element:
+                    continue
+                # Remove any span tags (like [INFERNO ONLY])
+                name_text = name_element.get_text().strip()
+                # Clean up the name by removing special indicators
+                name = _BRACKET_RE.sub('', name_text).strip()
                 
-                # Extract type and convert to list
-                type_element = container.find('div', class_='etheria-matrix-info')
-                if type_element:
-                    type_p = type_element.find('p')
-                    if type_p and 'Type:' in type_p.get_text():
-                        type_strong = type_p.find('strong')
-                        if type_strong:
-                            type_text = type_strong.get_text().strip()
-                            # Split by '/' and strip whitespace from each part
-                            matrix_data['type'] = [t.strip() for t in type_text.split('/')]
+                # Skip nameless and already seen matrices before extracting anything else
+                if not name or name in seen_names:
+                    continue
+                seen_names.add(name)
+                matrix_data = {'name': name}
                 
-                # Extract source
-                source_element = container.find('div', class_='etheria-matrix-info')
-                if source_element:
-                    source_ps = source_element.find_all('p')
-                    for p in source_ps:
-                        if 'Source:' in p.get_text():
+                # Extract type (first paragraph) and source in one pass over the paragraphs
+                if info_element:
+                    for position, p in enumerate(info_element.find_all('p')):
+                        text = p.get_text()
+                        if position == 0 and 'Type:' in text:
+                            type_strong = p.find('strong')
+                            if type_strong:
+                                type_text = type_strong.get_text().strip()
+                                # Split by '/' and strip whitespace from each part; types and sources
+                                # come from a small vocabulary, so every matrix shares the same strings
+                                matrix_data['type'] = [sys.intern(t.strip()) for t in type_text.split('/')]
+                        if 'Source:' in text:
                             source_strong = p.find('strong')
                             if source_strong:
-                                matrix_data['source'] = source_strong.get_text().strip()
+                                matrix_data['source'] = sys.intern(source_strong.get_text().strip())
                             break
                 
                 # Extract effects
-                content_element = container.find('div', class_='etheria-matrix-content')
                 if content_element:
-                    effects = []
-                    effect_ps = content_element.find_all('p')
-                    
-                    for p in effect_ps:
-                        # Parse effect text to extract the matrix count and effect description
-                        effect_text = p.get_text().strip()
-                        
-                        # Match patterns like "4/8: " or "12/12: "
-                        match = re.match(r'(\d+)/(\d+):\s*(.+)', effect_text)
-                        if match:
-                            required_count = match.group(1)
-                            total_count = match.group(2)
-                            effect_desc = match.group(3)
-                            
-                            # Clean up the effect description
-                            # Remove HTML entities and extra spaces
-                            effect_desc = re.sub(r'&nbsp;', ' ', effect_desc)
-                            effect_desc = re.sub(r'\s+', ' ', effect_desc).strip()
-                            
-                            # Parse the effect using the new parsing function
-                            parsed_effect = self.parse_effect_text(effect_desc)
-                            
-                            effect_entry = {
-                                'required': int(required_count),
-                                'total': int(total_count),
-                                'effect': parsed_effect['effect']
-                            }
-                            
-                            # Only add extra_effect if it exists and is not empty
-                            if parsed_effect['extra_effect']:
-                                effect_entry['extra_effect'] = parsed_effect['extra_effect']
-                            
-                            effects.append(effect_entry)
-                    
-                    matrix_data['effects'] = effects
+                    # Effect lines look like "4/8: ..." or "12/12: ..."; other paragraphs are skipped,
+                    # without running the regex when the text does not even start with a digit
+                    texts = (p.get_text().strip() for p in content_element.find_all('p'))
+                    matrix_data['effects'] = [
+                        self._build_effect_entry(match)
+                        for match in (_MATRIX_EFFECT_RE.match(text) for text in texts if text[:1].isdigit())
+                        if match
+                    ]
                 
-                # Only add if we have a name and haven't seen this matrix before
-                if matrix_data.get('name') and matrix_data['name'] not in seen_names:
-                    seen_names.add(matrix_data['name'])
-                    matrix_effects.append(matrix_data)
+                matrix_effects.append(matrix_data)
         
         except Exception as e:
             print(f"Error extracting matrix effects: {e}")
@@ -191,6 +210,50 @@ class MatrixEffectsParser:
         self.matrix_effects = matrix_effects
         return matrix_effects
     
+    def _find_matrix_parts(self, container):
+        """Find the name heading, info block and content block in one walk of a container"""
+        name_element = info_element = content_element = None
+        
+        for element in container.descendants:
+            if element.name == 'h4':
+                if name_element is None:
+                    name_element = element
+            elif element.name == 'div':
+                classes = element.get('class') or ()
+                if info_element is None and 'etheria-matrix-info' in classes:
+                    info_element = element
+                elif content_element is None and 'etheria-matrix-content' in classes:
+                    content_element = element
+            else:
+                continue
+            
+            # Stop walking once every part has been found
+            if name_element is not None and info_element is not None and content_element is not None:
+                break
+        
+        return name_element, info_element, content_element
+    
+    def _build_effect_entry(self, match):
+        """Build one effect entry from a matched 'required/total: description' line"""
+        # Clean up the effect description; the parser has already decoded
+        # &nbsp; into U+00A0, which \s matches along with the other extra spaces
+        effect_desc = _WS_RE.sub(' ', match.group(3)).strip()
+        
+        # Parse the effect using the new parsing function
+        parsed_effect = self.parse_effect_text(effect_desc)
+        
+        effect_entry = {
+            'required': int(match.group(1)),
+            'total': int(match.group(2)),
+            'effect': parsed_effect['effect']
+        }
+        
+        # Only add extra_effect if it exists and is not empty
+        if parsed_effect['extra_effect']:
+            effect_entry['extra_effect'] = parsed_effect['extra_effect']
+        
+        return effect_entry
+    
     def save_to_database(self, validate_order=True):
         """Save extracted data to unified database
         
@@ -208,18 +271,15 @@ class MatrixEffectsParser:
                 print("⚠️  Warning: Shells or characters already exist. Matrix effects should be inserted first.")
         
         try:
-            # Insert all matrix effects using unified database
-            inserted_count = 0
-            failed_count = 0
+            # Insert all matrix effects using unified database, in one transaction
+            matrix_ids = self.db_manager.matrices.insert_matrix_effects(self.matrix_effects)
+            failed_names = [matrix_data['name'] for matrix_data, matrix_id in zip(self.matrix_effects, matrix_ids)
+                            if not matrix_id]
+            inserted_count = len(matrix_ids) - len(failed_names)
+            failed_count = len(failed_names)
             
-            for matrix_data in self.matrix_effects:
-                matrix_id = self.db_manager.matrices.insert_matrix_effect(matrix_data)
-                if matrix_id:
-                    inserted_count += 1
-                    print(f"✅ Inserted matrix: {matrix_data['name']} (ID: {matrix_id})")
-                else:
-                    failed_count += 1
-                    print(f"❌ Failed to insert matrix: {matrix_data['name']}")
+            if failed_names:
+                print(f"❌ Failed to insert matrices: {', '.join(failed_names)}")
             
             print(f"\n=== Matrix Database Save Summary ===")
             print(f"Matrix effects saved to database: {inserted_count}")
@@ -239,35 +299,58 @@ class MatrixEffectsParser:
     def save_to_json(self, output_file):
         """Save extracted data to JSON file (backup option)"""
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(self.matrix_effects, f, indent=2, ensure_ascii=False)
+            if orjson:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(self.matrix_effects, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.matrix_effects, f, indent=2, ensure_ascii=False)
             print(f"Matrix effects data also saved to {output_file}")
         except Exception as e:
             print(f"Error saving JSON backup: {e}")
     
     def print_matrix_effects(self):
         """Print all matrix effects in a formatted way"""
+        # Build every line first and write them out at once
+        lines = []
         for i, matrix in enumerate(self.matrix_effects, 1):
-            print(f"\n{i}. Matrix Effect:")
-            print(f"   Name: {matrix.get('name', 'Unknown')}")
+            lines.append(f"\n{i}. Matrix Effect:")
+            lines.append(f"   Name: {matrix.get('name', 'Unknown')}")
             # Convert type list back to string for display
-            type_list = matrix.get('type', ['Unknown'])
-            print(f"   Type: {' / '.join(type_list)}")
-            print(f"   Source: {matrix.get('source', 'Unknown')}")
+            lines.append(f"   Type: {' / '.join(matrix.get('type', ['Unknown']))}")
+            lines.append(f"   Source: {matrix.get('source', 'Unknown')}")
             
-            effects = matrix.get('effects', [])
-            for effect in effects:
+            for effect in matrix.get('effects', []):
                 # Display stat bonuses
-                stat_parts = []
-                for stat, value in effect['effect'].items():
-                    stat_parts.append(f"{stat} +{value}")
-                stats_str = ', '.join(stat_parts) if stat_parts else 'No stat bonuses'
-                
-                print(f"   {effect['required']}/{effect['total']}: {stats_str}")
+                stats_str = ', '.join(f"{stat} +{value}" for stat, value in effect['effect'].items())
+                lines.append(f"   {effect['required']}/{effect['total']}: {stats_str or 'No stat bonuses'}")
                 
                 # Display extra effect if present
                 if 'extra_effect' in effect:
-                    print(f"      Extra: {effect['extra_effect']}")
+                    lines.append(f"      Extra: {effect['extra_effect']}")
+        
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
+    
+    @classmethod
+    def process_files(cls, html_files, db_path="./db/etheria.db", max_workers=None):
+        """Parse several matrix files and save them through one database manager in one transaction"""
+        # Files are parsed in parallel worker processes; only the save is serial
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            matrix_effects = [matrix_data
+                              for file_effects in executor.map(_parse_one, html_files)
+                              for matrix_data in file_effects]
+        
+        if not DATABASE_AVAILABLE:
+            print("Database mode not enabled")
+            return 0
+        
+        # One manager (and connection) for the whole batch
+        db_manager = EtheriaManager(db_path)
+        matrix_ids = db_manager.matrices.insert_matrix_effects(matrix_effects)
+        inserted_count = sum(1 for matrix_id in matrix_ids if matrix_id)
+        print(f"Matrix effects saved to database: {inserted_count}/{len(matrix_effects)} from {len(html_files)} files")
+        return inserted_count
     
     def parse(self):
         """Main parsing function"""
@@ -275,14 +358,30 @@ class MatrixEffectsParser:
             return False
         
         self.extract_matrix_effects()
+        
+        # The extracted dicts are all that is used from here on; release the tree
+        self.soup = None
         return True
 
 
+def _parse_one(html_file):
+    """Parse one matrix file and return its effects (batch worker)"""
+    parser = MatrixEffectsParser(html_file, use_database=False)
+    return parser.matrix_effects if parser.parse() else []
+
+
 def main():
     # Default file path
     html_file = '/home/hong/code/python/etheria_sim/var/MatrixEffects.html'
     
-    # Allow command line argument for file path
+    # Allow command line arguments for file paths; several files are parsed in parallel
+    if len(sys.argv) > 2:
+        missing = [path for path in sys.argv[1:] if not os.path.exists(path)]
+        if missing:
+            print(f"Error: Files not found: {', '.join(missing)}")
+            return
+        MatrixEffectsParser.process_files(sys.argv[1:])
+        return
     if len(sys.argv) > 1:
         html_file = sys.argv[1]
     
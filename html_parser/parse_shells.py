@@ -1,13 +1,16 @@
 import os
 import sys
-from bs4 import BeautifulSoup
-import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from bs4 import BeautifulSoup, SoupStrainer
 import json
 
-# Add parent directory to path for database imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir = os.path.dirname(current_dir)
-sys.path.insert(0, parent_dir)
+# Imported as html_parser.parse_shells the db package already resolves; only when run
+# as a script does the project root need to be put on the path for database imports
+if not __package__:
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(current_dir)
+    sys.path.insert(0, parent_dir)
 
 try:
     from db.etheria_manager import EtheriaManager
@@ -17,11 +20,115 @@ except ImportError as e:
     print("Running in JSON-only mode")
     DATABASE_AVAILABLE = False
 
+# Serialize JSON in C when orjson is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libxml2-backed tree builder when lxml is installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+
+# Attribute matchers for bs4 lookups; plain substring tests, no regex engine involved
+def _is_rarity_class(value):
+    """Match a class value containing 'rarity'"""
+    return value is not None and 'rarity' in value
+
+
+def _is_single_shell_class(value):
+    """Match a class string that includes 'single-shell' (SoupStrainer passes the whole string)"""
+    return value is not None and 'single-shell' in value.split()
+
+
+def _is_skill_tab_id(value):
+    """Match the skill tab pane id ('...-tabpane-skill')"""
+    return value is not None and '-tabpane-skill' in value
+
+
+def _is_stat_tab_id(value):
+    """Match the stats tab pane id ('...-tabpane-stat')"""
+    return value is not None and '-tabpane-stat' in value
+
+
+# Only the shell containers are kept when the page is parsed
+_SHELLS_ONLY = SoupStrainer('div', class_=_is_single_shell_class)
+
+
+# Image attributes checked, in order, when a set has no noscript fallback
+_SET_SRC_ATTRS = ('data-lazy-src', 'data-src', 'src')
+
+
+def _set_name_from_src(src):
+    """Return the capitalized set name from a filename like "set_wellspring.webp", or None"""
+    _, marker, tail = src.rpartition('set_')
+    if not marker:
+        return None
+    return tail.partition('.webp')[0].capitalize()
+
+
+def iter_shells(soup):
+    """Yield every div.single-shell element of a parsed page in document order"""
+    for element in soup.descendants:
+        if element.name == 'div' and 'single-shell' in (element.get('class') or ()):
+            yield element
+
+
+class ShellView:
+    """Sub-elements of one single-shell element, located in a single walk of its subtree"""
+    
+    __slots__ = ('name_elem', 'rarity_elem', 'info_div', 'skill_tab', 'stats_tabpane', 'sets_div')
+    
+    def __init__(self, shell_element):
+        self.name_elem = self.rarity_elem = self.info_div = None
+        self.skill_tab = self.stats_tabpane = self.sets_div = None
+        
+        # Keep the first match of each part in document order, as find() would
+        remaining = 6
+        for element in shell_element.descendants:
+            tag = element.name
+            if tag == 'div':
+                classes = element.get('class') or ()
+                element_id = element.get('id')
+                if self.info_div is None and 'eth-shell-info' in classes:
+                    self.info_div = element
+                    remaining -= 1
+                if self.sets_div is None and 'eth-shell-sets' in classes:
+                    self.sets_div = element
+                    remaining -= 1
+                if (self.skill_tab is None and element.get('role') == 'tabpanel'
+                        and _is_skill_tab_id(element_id)):
+                    self.skill_tab = element
+                    remaining -= 1
+                if self.stats_tabpane is None and _is_stat_tab_id(element_id):
+                    self.stats_tabpane = element
+                    remaining -= 1
+            elif tag == 'h4':
+                if self.name_elem is None:
+                    self.name_elem = element
+                    remaining -= 1
+            elif tag == 'strong':
+                if self.rarity_elem is None and _is_rarity_class(' '.join(element.get('class') or ())):
+                    self.rarity_elem = element
+                    remaining -= 1
+            else:
+                continue
+            
+            # Stop walking once every part has been found
+            if not remaining:
+                break
+
 
 class ShellParser:
-    def __init__(self, html_file_path, use_database=True, db_path="./db/etheria.db"):
+    def __init__(self, html_file_path, use_database=True, db_path="./db/etheria.db", verbose=False):
         """Initialize parser with HTML file path as parameter"""
         self.html_file = html_file_path
+        # Per-shell progress is only reported when verbose, keeping batch runs quiet
+        self.verbose = verbose
         self.soup = None
         self.data = {}
         self.shells_data = []
@@ -36,62 +143,49 @@ class ShellParser:
     def load_html(self):
         """Load the HTML file"""
         try:
-            with open(self.html_file, 'r', encoding='utf-8') as file:
-                content = file.read()
-                self.soup = BeautifulSoup(content, 'html.parser')
+            # Hand the open binary file to the parser; it reads and decodes it natively,
+            # building tree nodes only for the shell subtrees that are actually parsed
+            with open(self.html_file, 'rb') as file:
+                self.soup = BeautifulSoup(file, HTML_PARSER, from_encoding='utf-8',
+                                          parse_only=_SHELLS_ONLY)
                 print(f"HTML file loaded successfully: {self.html_file}")
         except Exception as e:
             print(f"Error loading HTML file: {e}")
             return False
         return True
     
-    def extract_shell_basic_info(self, shell_element):
+    def extract_shell_basic_info(self, shell_element, view=None):
         """Extract basic info from a single shell element"""
         basic_info = {}
         
         try:
+            if view is None:
+                view = ShellView(shell_element)
+            
             # Extract name from h4 tag
-            name_elem = shell_element.find('h4')
+            name_elem = view.name_elem
             basic_info['name'] = name_elem.get_text(strip=True) if name_elem else 'Unknown'
             
             # Extract rarity from strong tag with class "rarity"
-            rarity_elem = shell_element.find('strong', class_=re.compile(r'rarity'))
+            rarity_elem = view.rarity_elem
             if rarity_elem:
                 basic_info['rarity'] = rarity_elem.get_text(strip=True)
             else:
                 basic_info['rarity'] = 'Unknown'
             
-            # Extract class from the info section
-            info_div = shell_element.find('div', class_='eth-shell-info')
-            if info_div:
-                class_p = info_div.find_all('p')[1] if len(info_div.find_all('p')) > 1 else None
-                if class_p:
-                    class_text = class_p.get_text(strip=True)
-                    # Extract class after "Class: "
-                    if 'Class:' in class_text:
-                        basic_info['class'] = class_text.split('Class:')[1].strip()
-                    else:
-                        basic_info['class'] = 'Unknown'
-                else:
-                    basic_info['class'] = 'Unknown'
-            else:
-                basic_info['class'] = 'Unknown'
+            # Extract class and cooldown from the second and third paragraphs of the
+            # info section; one lookup, stopping once those paragraphs are found
+            info_div = view.info_div
+            info_ps = info_div.find_all('p', limit=3) if info_div else []
+            class_p = info_ps[1] if len(info_ps) > 1 else None
+            cooldown_p = info_ps[2] if len(info_ps) > 2 else None
             
-            # Extract cooldown from the info section
-            if info_div:
-                cooldown_p = info_div.find_all('p')[2] if len(info_div.find_all('p')) > 2 else None
-                if cooldown_p:
-                    cooldown_text = cooldown_p.get_text(strip=True)
-                    # Extract cooldown after "Cooldown: "
-                    if 'Cooldown:' in cooldown_text:
-                        cooldown_value = cooldown_text.split('Cooldown:')[1].strip()
-                        basic_info['cooldown'] = cooldown_value
-                    else:
-                        basic_info['cooldown'] = 'Unknown'
-                else:
-                    basic_info['cooldown'] = 'Unknown'
-            else:
-                basic_info['cooldown'] = 'Unknown'
+            # Take the text after "Class: " / "Cooldown: " with one partition each
+            _, sep, shell_class = class_p.get_text(strip=True).partition('Class:') if class_p else ('', '', '')
+            basic_info['class'] = shell_class.strip() if sep else 'Unknown'
+            
+            _, sep, cooldown = cooldown_p.get_text(strip=True).partition('Cooldown:') if cooldown_p else ('', '', '')
+            basic_info['cooldown'] = cooldown.strip() if sep else 'Unknown'
                 
         except Exception as e:
             print(f"Error extracting basic info for shell: {e}")
@@ -104,13 +198,16 @@ class ShellParser:
         
         return basic_info
     
-    def extract_shell_skills(self, shell_element):
+    def extract_shell_skills(self, shell_element, view=None):
         """Extract skill information from shell element"""
         skills = {}
         
         try:
+            if view is None:
+                view = ShellView(shell_element)
+            
             # Find the skill tab content
-            skill_tab = shell_element.find('div', role='tabpanel', id=re.compile(r'.*-tabpane-skill'))
+            skill_tab = view.skill_tab
             if not skill_tab:
                 return skills
             
@@ -120,30 +217,33 @@ class ShellParser:
             for h5 in h5_elements:
                 h5_text = h5.get_text(strip=True)
                 
-                # Check if this is non-awakened skill first (more specific)
+                # Classify the heading once; non-awakened first since it is more specific
                 if 'Non-Awakened' in h5_text:
-                    skill_div = h5.find_next_sibling('div', class_='skill-with-coloring')
-                    if skill_div:
-                        skills['non_awakened'] = skill_div.get_text(strip=True)
-                
-                # Check if this is awakened skill (less specific)
+                    skill_kind = 'non_awakened'
                 elif 'Awakened' in h5_text:
-                    skill_div = h5.find_next_sibling('div', class_='skill-with-coloring')
-                    if skill_div:
-                        skills['awakened'] = skill_div.get_text(strip=True)
+                    skill_kind = 'awakened'
+                else:
+                    continue
+                
+                skill_div = h5.find_next_sibling('div', class_='skill-with-coloring')
+                if skill_div:
+                    skills[skill_kind] = skill_div.get_text(strip=True)
                         
         except Exception as e:
             print(f"Error extracting skills for shell: {e}")
             
         return skills
     
-    def extract_shell_stats(self, shell_element):
+    def extract_shell_stats(self, shell_element, view=None):
         """Extract stats from shell element"""
         stats = {}
         
         try:
+            if view is None:
+                view = ShellView(shell_element)
+            
             # Find stats content in the Stats tab
-            stats_tabpane = shell_element.find('div', id=re.compile(r'.*-tabpane-stat'))
+            stats_tabpane = view.stats_tabpane
             if stats_tabpane:
                 specialities_list = stats_tabpane.find('div', class_='specialities-list')
                 if specialities_list:
@@ -159,13 +259,16 @@ class ShellParser:
             
         return stats
     
-    def extract_matrix_sets(self, shell_element):
+    def extract_matrix_sets(self, shell_element, view=None):
         """Extract matrix set information from shell element"""
         matrix_sets = []
         
         try:
+            if view is None:
+                view = ShellView(shell_element)
+            
             # Find sets container
-            sets_div = shell_element.find('div', class_='eth-shell-sets')
+            sets_div = view.sets_div
             if sets_div:
                 set_divs = sets_div.find_all('div', class_='single-set')
                 for set_div in set_divs:
@@ -174,22 +277,19 @@ class ShellParser:
                     if noscript_elem:
                         noscript_img = noscript_elem.find('img')
                         if noscript_img:
-                            src = noscript_img.get('src', '')
-                            if 'set_' in src:
-                                # Extract set name from filename like "set_wellspring.webp"
-                                set_name = src.split('set_')[-1].split('.webp')[0]
-                                matrix_sets.append(set_name.capitalize())
+                            set_name = _set_name_from_src(noscript_img.get('src', ''))
+                            if set_name is not None:
+                                matrix_sets.append(set_name)
                     
                     # Fallback: check regular img if noscript not found
-                    if not noscript_elem:
+                    else:
                         img_elem = set_div.find('img')
                         if img_elem:
                             # Check data-lazy-src or other attributes
-                            for attr in ['data-lazy-src', 'data-src', 'src']:
-                                src = img_elem.get(attr, '')
-                                if 'set_' in src:
-                                    set_name = src.split('set_')[-1].split('.webp')[0]
-                                    matrix_sets.append(set_name.capitalize())
+                            for attr in _SET_SRC_ATTRS:
+                                set_name = _set_name_from_src(img_elem.get(attr, ''))
+                                if set_name is not None:
+                                    matrix_sets.append(set_name)
                                     break
                             
         except Exception as e:
@@ -197,41 +297,65 @@ class ShellParser:
             
         return matrix_sets
     
-    def parse_all_shells(self):
-        """Parse all shells from the HTML"""
+    def extract_shell(self, shell_element):
+        """Extract all data for a single shell element"""
+        shell_data = {}
+        
+        # Locate every part the extractors need in one walk of the shell
+        view = ShellView(shell_element)
+        
+        # Extract basic info
+        basic_info = self.extract_shell_basic_info(shell_element, view)
+        shell_data.update(basic_info)
+        
+        # Extract skills
+        skills = self.extract_shell_skills(shell_element, view)
+        if skills:
+            shell_data['skills'] = skills
+        
+        # Extract stats
+        stats = self.extract_shell_stats(shell_element, view)
+        if stats:
+            shell_data['stats'] = stats
+        
+        # Extract matrix sets
+        matrix_sets = self.extract_matrix_sets(shell_element, view)
+        if matrix_sets:
+            shell_data['sets'] = matrix_sets
+        
+        return shell_data
+    
+    def parse_all_shells(self, parallel=False, max_workers=None):
+        """Parse all shells from the HTML
+        
+        Args:
+            parallel: If True, extract shells in worker processes from their HTML fragments
+            max_workers: Worker process count for parallel mode (defaults to the CPU count)
+        """
         if not self.soup:
             print("HTML not loaded. Call load_html() first.")
             return []
         
-        # Find all shell elements
-        shell_elements = self.soup.find_all('div', class_='single-shell')
+        # Stream shell elements straight out of the tree instead of collecting them first
+        shell_elements = iter_shells(self.soup)
         
-        print(f"Found {len(shell_elements)} shell elements")
+        if parallel:
+            # Each worker re-parses just its shell's markup, so only strings cross processes
+            fragments = (str(shell_element) for shell_element in shell_elements)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                parsed_shells = list(executor.map(_parse_shell_fragment, fragments, chunksize=16))
+        else:
+            parsed_shells = list(map(self.extract_shell, shell_elements))
         
-        for i, shell_element in enumerate(shell_elements):
-            shell_data = {}
-            
-            # Extract basic info
-            basic_info = self.extract_shell_basic_info(shell_element)
-            shell_data.update(basic_info)
-            
-            # Extract skills
-            skills = self.extract_shell_skills(shell_element)
-            if skills:
-                shell_data['skills'] = skills
-            
-            # Extract stats
-            stats = self.extract_shell_stats(shell_element)
-            if stats:
-                shell_data['stats'] = stats
-            
-            # Extract matrix sets
-            matrix_sets = self.extract_matrix_sets(shell_element)
-            if matrix_sets:
-                shell_data['sets'] = matrix_sets
-            
-            self.shells_data.append(shell_data)
-            print(f"Processed shell {i+1}: {shell_data.get('name', 'Unknown')}")
+        self.shells_data.extend(parsed_shells)
+        
+        # Report progress in one write after the loop rather than one print per shell
+        if self.verbose and parsed_shells:
+            lines = [f"Processed shell {i}: {shell_data.get('name', 'Unknown')}"
+                     for i, shell_data in enumerate(parsed_shells, 1)]
+            sys.stdout.write('\n'.join(lines) + '\n')
+        
+        print(f"Found {len(parsed_shells)} shell elements")
         
         return self.shells_data
     
@@ -258,6 +382,9 @@ class ShellParser:
             failed_count = 0
             validation_warnings = 0
             
+            # Fetch the known matrix names once instead of querying per reference
+            known_matrices = self.db_manager.matrices.get_matrix_names() if validate_matrix_refs else set()
+            
             for shell_data in self.shells_data:
                 # Validate matrix set references if enabled
                 if validate_matrix_refs and 'sets' in shell_data:
@@ -265,8 +392,7 @@ class ShellParser:
                     validated_sets = []
                     
                     for matrix_name in original_sets:
-                        matrix = self.db_manager.matrices.get_matrix_effect_by_name(matrix_name)
-                        if matrix:
+                        if matrix_name in known_matrices:
                             validated_sets.append(matrix_name)
                         else:
                             print(f"  ⚠️  Matrix reference not found in database: {matrix_name}")
@@ -278,17 +404,22 @@ class ShellParser:
                     if len(validated_sets) != len(original_sets):
                         shell_name = shell_data.get('name', 'Unknown')
                         print(f"  📝 Shell '{shell_name}': {len(original_sets)} -> {len(validated_sets)} matrix references")
-                
-                # Insert shell into database
-                shell_id = self.db_manager.shells.insert_shell(shell_data)
+            
+            # Insert all validated shells in one transaction
+            shell_ids = self.db_manager.shells.insert_shells(self.shells_data)
+            lines = []
+            for shell_data, shell_id in zip(self.shells_data, shell_ids):
                 if shell_id:
                     inserted_count += 1
-                    shell_name = shell_data.get('name', 'Unknown')
-                    matrix_count = len(shell_data.get('sets', []))
-                    print(f"✅ Inserted shell: {shell_name} (ID: {shell_id}) with {matrix_count} matrix references")
+                    if self.verbose:
+                        shell_name = shell_data.get('name', 'Unknown')
+                        matrix_count = len(shell_data.get('sets', []))
+                        lines.append(f"✅ Inserted shell: {shell_name} (ID: {shell_id}) with {matrix_count} matrix references")
                 else:
                     failed_count += 1
-                    print(f"❌ Failed to insert shell: {shell_data.get('name', 'Unknown')}")
+                    lines.append(f"❌ Failed to insert shell: {shell_data.get('name', 'Unknown')}")
+            if lines:
+                sys.stdout.write('\n'.join(lines) + '\n')
             
             print(f"\n=== Shell Database Save Summary ===")
             print(f"Total shells saved to database: {inserted_count}")
@@ -314,8 +445,13 @@ class ShellParser:
             output_file = f"{base_name}_parsed.json"
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(self.shells_data, f, ensure_ascii=False, indent=2)
+            # Encode the whole document once and write the bytes in a single call
+            if orjson:
+                data = orjson.dumps(self.shells_data, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.shells_data, ensure_ascii=False, indent=2).encode('utf-8')
+            with open(output_file, 'wb') as f:
+                f.write(data)
             print(f"Data saved to {output_file}")
             print(f"Total shells parsed: {len(self.shells_data)}")
         except Exception as e:
@@ -378,16 +514,9 @@ class ShellParser:
         print(f"\n=== Shell Parser Summary ===")
         print(f"Total shells parsed: {len(self.shells_data)}")
         
-        # Group by rarity
-        rarity_count = {}
-        class_count = {}
-        
-        for shell in self.shells_data:
-            rarity = shell.get('rarity', 'Unknown')
-            shell_class = shell.get('class', 'Unknown')
-            
-            rarity_count[rarity] = rarity_count.get(rarity, 0) + 1
-            class_count[shell_class] = class_count.get(shell_class, 0) + 1
+        # Group by rarity and class
+        rarity_count = Counter(shell.get('rarity', 'Unknown') for shell in self.shells_data)
+        class_count = Counter(shell.get('class', 'Unknown') for shell in self.shells_data)
         
         print(f"\nBy Rarity:")
         for rarity, count in rarity_count.items():
@@ -403,6 +532,12 @@ class ShellParser:
             print(f"  {i+1}. {shell.get('name', 'Unknown')} ({shell.get('rarity', 'Unknown')}, {shell.get('class', 'Unknown')})")
 
 
+def _parse_shell_fragment(fragment):
+    """Extract one shell from its HTML fragment (parallel worker)"""
+    soup = BeautifulSoup(fragment, HTML_PARSER)
+    return ShellParser(None, use_database=False).extract_shell(soup.find('div', class_='single-shell'))
+
+
 def main():
     """Main function to run the parser"""
     if len(sys.argv) < 2:
@@ -422,7 +557,7 @@ def main():
         sys.exit(1)
     
     # Create parser and process
-    parser = ShellParser(html_file, use_database=not json_only)
+    parser = ShellParser(html_file, use_database=not json_only, verbose=True)
     
     if not parser.load_html():
         print("Failed to load HTML file")
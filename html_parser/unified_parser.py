@@ -112,78 +112,80 @@ class UnifiedParser:
         print("STORING DATA TO UNIFIED DATABASE")
         print("="*50)
         
-        # Step 1: Store matrix effects first (no dependencies)
-        if self.matrix_parser and self.matrix_parser.matrix_effects:
-            print("\n=== Step 1: Storing Matrix Effects ===")
-            
-            for matrix_data in self.matrix_parser.matrix_effects:
-                try:
-                    matrix_id = self.db_manager.matrices.insert_matrix_effect(matrix_data)
-                    if matrix_id:
-                        self.stats['matrices_inserted'] += 1
-                        print(f"✅ Inserted matrix: {matrix_data['name']} (ID: {matrix_id})")
-                    else:
-                        print(f"❌ Failed to insert matrix: {matrix_data['name']}")
-                        self.stats['total_errors'] += 1
-                        
-                except Exception as e:
-                    print(f"❌ Error inserting matrix {matrix_data.get('name', 'Unknown')}: {e}")
-                    self.stats['total_errors'] += 1
+        # All three steps share one transaction, so the whole import costs a single commit
+        try:
+            with self.db_manager.transaction():
+                self._store_matrix_effects()
+                self._store_shells()
+                self._store_characters()
+        except Exception as e:
+            print(f"❌ Error storing data to database: {e}")
+            self.stats['total_errors'] += 1
+    
+    def _store_matrix_effects(self):
+        """Store matrix effects first (no dependencies)"""
+        if not (self.matrix_parser and self.matrix_parser.matrix_effects):
+            return
+        print("\n=== Step 1: Storing Matrix Effects ===")
         
-        # Step 2: Store shells (depends on matrix effects for sets)
-        if self.shell_parser and self.shell_parser.shells_data:
-            print("\n=== Step 2: Storing Shells ===")
-            
-            for shell_data in self.shell_parser.shells_data:
-                try:
-                    # Validate matrix sets exist before inserting shell
-                    matrix_sets = shell_data.get('sets', [])
-                    valid_sets = []
-                    
-                    for matrix_name in matrix_sets:
-                        matrix = self.db_manager.matrices.get_matrix_effect_by_name(matrix_name)
-                        if matrix:
-                            valid_sets.append(matrix_name)
-                            print(f"  ✅ Matrix reference validated: {matrix_name}")
-                        else:
-                            print(f"  ⚠️  Matrix reference not found: {matrix_name}")
-                    
-                    # Update shell data with validated sets
-                    shell_data['sets'] = valid_sets
-                    
-                    shell_id = self.db_manager.shells.insert_shell(shell_data)
-                    if shell_id:
-                        self.stats['shells_inserted'] += 1
-                        shell_name = shell_data.get('name', 'Unknown')
-                        print(f"✅ Inserted shell: {shell_name} (ID: {shell_id}) with {len(valid_sets)} matrix sets")
-                    else:
-                        print(f"❌ Failed to insert shell: {shell_data.get('name', 'Unknown')}")
-                        self.stats['total_errors'] += 1
-                        
-                except Exception as e:
-                    print(f"❌ Error inserting shell {shell_data.get('name', 'Unknown')}: {e}")
-                    self.stats['total_errors'] += 1
+        matrix_effects = self.matrix_parser.matrix_effects
+        matrix_ids = self.db_manager.matrices.insert_matrix_effects(matrix_effects)
+        for matrix_data, matrix_id in zip(matrix_effects, matrix_ids):
+            if matrix_id:
+                self.stats['matrices_inserted'] += 1
+                print(f"✅ Inserted matrix: {matrix_data['name']} (ID: {matrix_id})")
+            else:
+                print(f"❌ Failed to insert matrix: {matrix_data.get('name', 'Unknown')}")
+                self.stats['total_errors'] += 1
+    
+    def _store_shells(self):
+        """Store shells (depends on matrix effects for sets)"""
+        if not (self.shell_parser and self.shell_parser.shells_data):
+            return
+        print("\n=== Step 2: Storing Shells ===")
         
-        # Step 3: Store characters (no dependencies on shells/matrices for basic data)
-        if self.character_parsers:
-            print(f"\n=== Step 3: Storing {len(self.character_parsers)} Characters ===")
+        # Fetch the known matrix names once, including those inserted in step 1
+        known_matrices = self.db_manager.matrices.get_matrix_names()
+        shells_data = self.shell_parser.shells_data
+        for shell_data in shells_data:
+            # Validate matrix sets exist before inserting shell
+            valid_sets = []
+            for matrix_name in shell_data.get('sets', []):
+                if matrix_name in known_matrices:
+                    valid_sets.append(matrix_name)
+                    print(f"  ✅ Matrix reference validated: {matrix_name}")
+                else:
+                    print(f"  ⚠️  Matrix reference not found: {matrix_name}")
             
-            for character_parser in self.character_parsers:
-                try:
-                    character_id = self.db_manager.characters.insert_character(character_parser.character_data)
-                    if character_id:
-                        self.stats['characters_inserted'] += 1
-                        char_name = character_parser.character_data.get('basic_info', {}).get('name', 'Unknown')
-                        print(f"✅ Inserted character: {char_name} (ID: {character_id})")
-                    else:
-                        char_name = character_parser.character_data.get('basic_info', {}).get('name', 'Unknown')
-                        print(f"❌ Failed to insert character: {char_name}")
-                        self.stats['total_errors'] += 1
-                        
-                except Exception as e:
-                    char_name = character_parser.character_data.get('basic_info', {}).get('name', 'Unknown')
-                    print(f"❌ Error inserting character {char_name}: {e}")
-                    self.stats['total_errors'] += 1
+            # Update shell data with validated sets
+            shell_data['sets'] = valid_sets
+        
+        shell_ids = self.db_manager.shells.insert_shells(shells_data)
+        for shell_data, shell_id in zip(shells_data, shell_ids):
+            shell_name = shell_data.get('name', 'Unknown')
+            if shell_id:
+                self.stats['shells_inserted'] += 1
+                print(f"✅ Inserted shell: {shell_name} (ID: {shell_id}) with {len(shell_data['sets'])} matrix sets")
+            else:
+                print(f"❌ Failed to insert shell: {shell_name}")
+                self.stats['total_errors'] += 1
+    
+    def _store_characters(self):
+        """Store characters (no dependencies on shells/matrices for basic data)"""
+        if not self.character_parsers:
+            return
+        print(f"\n=== Step 3: Storing {len(self.character_parsers)} Characters ===")
+        
+        characters_data = [character_parser.character_data for character_parser in self.character_parsers]
+        character_ids = self.db_manager.characters.insert_characters(characters_data)
+        for character_data, character_id in zip(characters_data, character_ids):
+            char_name = character_data.get('basic_info', {}).get('name', 'Unknown')
+            if character_id:
+                self.stats['characters_inserted'] += 1
+                print(f"✅ Inserted character: {char_name} (ID: {character_id})")
+            else:
+                print(f"❌ Failed to insert character: {char_name}")
+                self.stats['total_errors'] += 1
     
     def print_final_summary(self):
         """Print final summary of parsing and storage operations"""
@@ -307,6 +309,7 @@ def main():
         shells_html=files_to_parse.get('shells'),
         character_html=files_to_parse.get('character')
     )
+    parser.db_manager.close()
 
 
 if __name__ == "__main__":
@@ -7,10 +7,22 @@ Handles SQLite storage and retrieval of modules and loadouts
 import sqlite3
 import json
 import os
-from typing import Dict, List, Optional, Any
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Any, Iterable
 from dataclasses import asdict
 
 
+# Applied to every connection: WAL lets readers run alongside a writer and avoids rewriting
+# a rollback journal on each commit; NORMAL sync is safe with WAL and skips most fsyncs
+CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode = WAL',
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA busy_timeout = 5000',
+)
+
+
 class MathicDatabase:
     """Database manager for mathic modules and loadouts"""
     
@@ -22,13 +34,51 @@ class MathicDatabase:
             db_path = os.path.join(mathic_dir, "mathic_data.db")
         
         self.db_path = db_path
+        # One long-lived connection shared by every method, serialized by the lock
+        self._conn = None
+        self._lock = threading.RLock()
+        self._depth = 0
         self.init_database()
     
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open the shared connection and apply the connection-level PRAGMAs"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def get_connection(self):
+        """Context manager yielding the shared connection, committing like sqlite3's own on success"""
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._open_connection()
+            conn = self._conn
+            self._depth += 1
+            try:
+                yield conn
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._depth -= 1
+            if self._depth == 0 and conn.in_transaction:
+                conn.commit()
+    
+    def close(self):
+        """Close the shared database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
     def init_database(self):
         """Initialize database tables"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('PRAGMA foreign_keys = ON')
-            
+        # foreign_keys stays off: it is a per-connection setting that only ever applied to the
+        # schema setup, and enabling it on the shared connection would make INSERT OR REPLACE
+        # of a module null out the loadout slots referencing it
+        with self.get_connection() as conn:
             # Create modules table
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS modules (
@@ -103,34 +153,8 @@ class MathicDatabase:
     def save_module(self, module) -> bool:
         """Save module to database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # Insert or update module
-                conn.execute('''
-                    INSERT OR REPLACE INTO modules (
-                        module_id, module_type, slot_position, level, main_stat, main_stat_value,
-                        set_tag, matrix, matrix_count, total_enhancement_rolls, max_total_rolls,
-                        max_enhancements, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ''', (
-                    module.module_id, module.module_type, module.slot_position, module.level,
-                    module.main_stat, module.main_stat_value, module.set_tag, module.matrix,
-                    module.matrix_count, module.total_enhancement_rolls, module.max_total_rolls,
-                    getattr(module, 'max_enhancements', 5)
-                ))
-                
-                # Delete existing substats
-                conn.execute('DELETE FROM substats WHERE module_id = ?', (module.module_id,))
-                
-                # Insert substats
-                for substat in module.substats:
-                    conn.execute('''
-                        INSERT INTO substats (module_id, stat_name, current_value, rolls_used, max_rolls)
-                        VALUES (?, ?, ?, ?, ?)
-                    ''', (
-                        module.module_id, substat.stat_name, substat.current_value,
-                        substat.rolls_used, substat.max_rolls
-                    ))
-                
+            with self.get_connection() as conn:
+                self._write_modules(conn, [module])
                 conn.commit()
                 return True
                 
@@ -138,12 +162,56 @@ class MathicDatabase:
             print(f"Error saving module {module.module_id}: {e}")
             return False
     
+    def save_modules(self, modules: Iterable[Any]) -> bool:
+        """Save many modules to database in one transaction"""
+        # A module listed twice is saved once, with its last state, as repeated save_module calls would
+        modules = list({module.module_id: module for module in modules}.values())
+        try:
+            with self.get_connection() as conn:
+                self._write_modules(conn, modules)
+                conn.commit()
+                return True
+                
+        except Exception as e:
+            print(f"Error saving {len(modules)} modules: {e}")
+            return False
+    
+    def _write_modules(self, conn, modules: List[Any]):
+        """Write modules and replace their substats without committing"""
+        # Insert or update modules
+        conn.executemany('''
+            INSERT OR REPLACE INTO modules (
+                module_id, module_type, slot_position, level, main_stat, main_stat_value,
+                set_tag, matrix, matrix_count, total_enhancement_rolls, max_total_rolls,
+                max_enhancements, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ''', [
+            (module.module_id, module.module_type, module.slot_position, module.level,
+             module.main_stat, module.main_stat_value, module.set_tag, module.matrix,
+             module.matrix_count, module.total_enhancement_rolls, module.max_total_rolls,
+             getattr(module, 'max_enhancements', 5))
+            for module in modules
+        ])
+        
+        # Delete existing substats
+        conn.executemany('DELETE FROM substats WHERE module_id = ?',
+                         [(module.module_id,) for module in modules])
+        
+        # Insert substats
+        conn.executemany('''
+            INSERT INTO substats (module_id, stat_name, current_value, rolls_used, max_rolls)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [
+            (module.module_id, substat.stat_name, substat.current_value,
+             substat.rolls_used, substat.max_rolls)
+            for module in modules
+            for substat in module.substats
+        ])
+    
     def load_module(self, module_id: str):
         """Load module from database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                
+            with self.get_connection() as conn:
                 # Load module data
                 module_row = conn.execute(
                     'SELECT * FROM modules WHERE module_id = ?', 
@@ -159,67 +227,77 @@ class MathicDatabase:
                     (module_id,)
                 ).fetchall()
                 
-                # Import here to avoid circular imports
-                from mathic.mathic_system import Module, Substat
-                
-                # Create substats
-                substats = []
-                for row in substat_rows:
-                    substat = Substat(
-                        stat_name=row['stat_name'],
-                        current_value=row['current_value'],
-                        rolls_used=row['rolls_used'],
-                        max_rolls=row['max_rolls']
-                    )
-                    substats.append(substat)
-                
-                # Handle max_enhancements field safely
-                try:
-                    max_enhancements = module_row['max_enhancements']
-                except (KeyError, IndexError):
-                    max_enhancements = 5
-                
-                # Create module
-                module = Module(
-                    module_id=module_row['module_id'],
-                    module_type=module_row['module_type'],
-                    slot_position=module_row['slot_position'],
-                    level=module_row['level'],
-                    main_stat=module_row['main_stat'],
-                    main_stat_value=module_row['main_stat_value'],
-                    substats=substats,
-                    set_tag=module_row['set_tag'],
-                    matrix=module_row['matrix'],
-                    matrix_count=module_row['matrix_count'],
-                    total_enhancement_rolls=module_row['total_enhancement_rolls'],
-                    max_total_rolls=module_row['max_total_rolls'],
-                    max_enhancements=max_enhancements
-                )
-                
-                # Calculate remaining enhancements based on current state
-                # Sync first to get accurate tracking
-                module.sync_enhancement_tracking()
-                
-                return module
+                return self._build_module(module_row, substat_rows)
                 
         except Exception as e:
             print(f"Error loading module {module_id}: {e}")
             return None
     
+    def _build_module(self, module_row, substat_rows):
+        """Build a Module from its row and its substat rows (ordered by id)"""
+        # Import here to avoid circular imports
+        from mathic.mathic_system import Module, Substat
+        
+        # Create substats
+        substats = []
+        for row in substat_rows:
+            substat = Substat(
+                stat_name=row['stat_name'],
+                current_value=row['current_value'],
+                rolls_used=row['rolls_used'],
+                max_rolls=row['max_rolls']
+            )
+            substats.append(substat)
+        
+        # Handle max_enhancements field safely
+        try:
+            max_enhancements = module_row['max_enhancements']
+        except (KeyError, IndexError):
+            max_enhancements = 5
+        
+        # Create module
+        module = Module(
+            module_id=module_row['module_id'],
+            module_type=module_row['module_type'],
+            slot_position=module_row['slot_position'],
+            level=module_row['level'],
+            main_stat=module_row['main_stat'],
+            main_stat_value=module_row['main_stat_value'],
+            substats=substats,
+            set_tag=module_row['set_tag'],
+            matrix=module_row['matrix'],
+            matrix_count=module_row['matrix_count'],
+            total_enhancement_rolls=module_row['total_enhancement_rolls'],
+            max_total_rolls=module_row['max_total_rolls'],
+            max_enhancements=max_enhancements
+        )
+        
+        # Calculate remaining enhancements based on current state
+        # Sync first to get accurate tracking
+        module.sync_enhancement_tracking()
+        
+        return module
+    
     def load_all_modules(self) -> Dict[str, Any]:
         """Load all modules from database"""
         modules = {}
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.get_connection() as conn:
+                module_rows = conn.execute('SELECT * FROM modules').fetchall()
                 
-                # Get all module IDs
-                module_ids = conn.execute('SELECT module_id FROM modules').fetchall()
+                # Fetch every substat in one query and group them by module
+                substats_by_module = {}
+                for row in conn.execute('SELECT * FROM substats ORDER BY id'):
+                    substats_by_module.setdefault(row['module_id'], []).append(row)
                 
-                for row in module_ids:
-                    module = self.load_module(row['module_id'])
-                    if module:
-                        modules[module.module_id] = module
+                for module_row in module_rows:
+                    module_id = module_row['module_id']
+                    try:
+                        module = self._build_module(module_row, substats_by_module.get(module_id, ()))
+                    except Exception as e:
+                        print(f"Error loading module {module_id}: {e}")
+                        continue
+                    modules[module.module_id] = module
                         
         except Exception as e:
             print(f"Error loading modules: {e}")
@@ -229,7 +307,7 @@ class MathicDatabase:
     def delete_module(self, module_id: str) -> bool:
         """Delete module from database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 conn.execute('DELETE FROM modules WHERE module_id = ?', (module_id,))
                 conn.commit()
                 return True
@@ -240,7 +318,7 @@ class MathicDatabase:
     def save_loadout(self, loadout_name: str, loadout_data: Dict[int, str], description: str = '') -> bool:
         """Save loadout to database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 # Insert or update loadout
                 conn.execute('''
                     INSERT OR REPLACE INTO loadouts (loadout_name, description, updated_at)
@@ -251,11 +329,11 @@ class MathicDatabase:
                 conn.execute('DELETE FROM loadout_slots WHERE loadout_name = ?', (loadout_name,))
                 
                 # Insert slots
-                for slot_position, module_id in loadout_data.items():
-                    conn.execute('''
-                        INSERT INTO loadout_slots (loadout_name, slot_position, module_id)
-                        VALUES (?, ?, ?)
-                    ''', (loadout_name, slot_position, module_id))
+                conn.executemany('''
+                    INSERT INTO loadout_slots (loadout_name, slot_position, module_id)
+                    VALUES (?, ?, ?)
+                ''', [(loadout_name, slot_position, module_id)
+                      for slot_position, module_id in loadout_data.items()])
                 
                 conn.commit()
                 return True
@@ -267,9 +345,7 @@ class MathicDatabase:
     def load_loadout(self, loadout_name: str) -> Optional[Dict[int, str]]:
         """Load loadout from database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                
+            with self.get_connection() as conn:
                 # Check if loadout exists
                 loadout_row = conn.execute(
                     'SELECT * FROM loadouts WHERE loadout_name = ?',
@@ -299,16 +375,18 @@ class MathicDatabase:
         """Load all loadouts from database"""
         loadouts = {}
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                
-                # Get all loadout names
-                loadout_rows = conn.execute('SELECT loadout_name FROM loadouts').fetchall()
+            with self.get_connection() as conn:
+                # Get all loadout names, then fill in every slot from one query
+                for row in conn.execute('SELECT loadout_name FROM loadouts'):
+                    loadouts[row['loadout_name']] = {}
                 
-                for row in loadout_rows:
-                    loadout_data = self.load_loadout(row['loadout_name'])
+                slot_rows = conn.execute(
+                    'SELECT loadout_name, slot_position, module_id FROM loadout_slots ORDER BY slot_position'
+                )
+                for row in slot_rows:
+                    loadout_data = loadouts.get(row['loadout_name'])
                     if loadout_data is not None:
-                        loadouts[row['loadout_name']] = loadout_data
+                        loadout_data[row['slot_position']] = row['module_id']
                         
         except Exception as e:
             print(f"Error loading loadouts: {e}")
@@ -318,7 +396,7 @@ class MathicDatabase:
     def delete_loadout(self, loadout_name: str) -> bool:
         """Delete loadout from database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 conn.execute('DELETE FROM loadouts WHERE loadout_name = ?', (loadout_name,))
                 conn.commit()
                 return True
@@ -329,7 +407,7 @@ class MathicDatabase:
     def get_loadout_names(self) -> List[str]:
         """Get all loadout names"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 rows = conn.execute('SELECT loadout_name FROM loadouts ORDER BY loadout_name').fetchall()
                 return [row[0] for row in rows]
         except Exception as e:
@@ -339,7 +417,7 @@ class MathicDatabase:
     def get_module_count(self) -> int:
         """Get total number of modules"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 result = conn.execute('SELECT COUNT(*) FROM modules').fetchone()
                 return result[0] if result else 0
         except Exception as e:
@@ -349,7 +427,7 @@ class MathicDatabase:
     def get_modules_by_type(self, module_type: str) -> List[str]:
         """Get module IDs by type"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 rows = conn.execute(
                     'SELECT module_id FROM modules WHERE module_type = ? ORDER BY module_id',
                     (module_type,)
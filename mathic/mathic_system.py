@@ -207,6 +207,10 @@ class MathicSystem:
         """Get all loadouts (loaded from database on access)"""
         return self.db.load_all_loadouts()
     
+    def close(self):
+        """Close the module database connection"""
+        self.db.close()
+    
     def load_config(self) -> Dict:
         """Load configuration from JSON file"""
         try:
@@ -1052,6 +1056,8 @@ def main():
         print(f"Saved to {save_path}")
     else:
         print("Save failed")
+    
+    mathic.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit tests for batch inserts and EtheriaManager.transaction()
+Covers joining the caller's transaction, per-row savepoints and rollback on error
+"""
+
+import unittest
+import tempfile
+import sys
+import os
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.etheria_manager import EtheriaManager
+
+
+def make_matrix(name):
+    """Build a minimal matrix effect"""
+    return {'name': name, 'source': 'Shop', 'type': ['Attack'], 'effects': []}
+
+
+def make_shell(name, sets=()):
+    """Build a minimal shell"""
+    return {'name': name, 'rarity': 'SSR', 'class': 'Support', 'cooldown': '4 turns',
+            'skills': {'awakened': 'Heals all.'}, 'stats': {'HP': '10%'}, 'sets': list(sets)}
+
+
+def make_character(name, dupe_effect='Boost'):
+    """Build a minimal character; a None dupe_effect violates a NOT NULL constraint"""
+    return {'basic_info': {'name': name, 'rarity': 'SSR', 'element': 'Fire'},
+            'stats': {'HP': {'total': '100', 'base': '90', 'bonus': '10'}},
+            'skills': [{'name': 'Strike', 'effect': 'Deal damage', 'tags': ['Damage']}],
+            'dupes': {'dupe_1': {'name': 'First', 'effect': dupe_effect}}}
+
+
+class TestEtheriaTransactions(unittest.TestCase):
+    """Test suite for batch inserts inside EtheriaManager.transaction()"""
+
+    def setUp(self):
+        """Create a manager on a fresh database"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = EtheriaManager(os.path.join(self.temp_dir.name, 'etheria.db'))
+
+    def tearDown(self):
+        """Close the database and remove it"""
+        self.manager.close()
+        self.temp_dir.cleanup()
+
+    def names(self, table):
+        """Return the committed names in a table"""
+        with self.manager.db.get_connection() as conn:
+            return sorted(row['name'] for row in conn.execute(f'SELECT name FROM {table}'))
+
+    def test_invalid_rows_do_not_undo_the_batch(self):
+        """A failing row is rolled back to its savepoint while the rest of the batch persists"""
+        with self.manager.transaction():
+            matrix_ids = self.manager.matrices.insert_matrix_effects(
+                [make_matrix('Bloom'), {'name': 'Broken'}, make_matrix('Quiet')])
+            shell_ids = self.manager.shells.insert_shells(
+                [make_shell('Aurora', ['Bloom']), {'rarity': 'SSR'}, make_shell('Bastion')])
+            character_ids = self.manager.characters.insert_characters(
+                [make_character('Plume'), make_character('Broken', dupe_effect=None)])
+
+        self.assertIsNone(matrix_ids[1])
+        self.assertIsNone(shell_ids[1])
+        self.assertIsNone(character_ids[1])
+        self.assertTrue(all(matrix_ids[0::2]) and all(shell_ids[0::2]) and character_ids[0])
+
+        self.assertEqual(self.names('matrix_effects'), ['Bloom', 'Quiet'])
+        self.assertEqual(self.names('shells'), ['Aurora', 'Bastion'])
+        self.assertEqual(self.names('characters'), ['Plume'])
+        with self.manager.db.get_connection() as conn:
+            self.assertEqual(conn.execute('SELECT COUNT(*) FROM character_dupes').fetchone()[0], 1)
+            self.assertEqual(conn.execute('SELECT COUNT(*) FROM shell_matrix_compatibility').fetchone()[0], 1)
+
+    def test_exception_in_block_rolls_back_everything(self):
+        """Batches joined to the transaction are undone when the block raises"""
+        with self.assertRaises(RuntimeError):
+            with self.manager.transaction():
+                self.manager.matrices.insert_matrix_effects([make_matrix('Bloom')])
+                self.manager.shells.insert_shells([make_shell('Aurora', ['Bloom'])])
+                self.manager.characters.insert_characters([make_character('Plume')])
+                raise RuntimeError('abort import')
+
+        self.assertEqual(self.names('matrix_effects'), [])
+        self.assertEqual(self.names('shells'), [])
+        self.assertEqual(self.names('characters'), [])
+
+    def test_one_commit_per_transaction(self):
+        """Batch inserts join the open transaction instead of committing their own"""
+        statements = []
+        with self.manager.db.get_connection() as conn:
+            conn.set_trace_callback(statements.append)
+            try:
+                with self.manager.transaction():
+                    self.manager.matrices.insert_matrix_effects([make_matrix('Bloom'), make_matrix('Quiet')])
+                    self.manager.shells.insert_shells([make_shell('Aurora'), make_shell('Bastion')])
+                    self.manager.characters.insert_characters([make_character('Plume')])
+            finally:
+                conn.set_trace_callback(None)
+
+        self.assertEqual([s for s in statements if s.strip().upper() == 'COMMIT'], ['COMMIT'])
+        self.assertEqual(self.names('shells'), ['Aurora', 'Bastion'])
+
+    def test_batch_commits_on_its_own_outside_transaction(self):
+        """Without an open transaction a batch insert commits its own work"""
+        self.manager.characters.insert_characters([make_character('Plume')])
+        with self.manager.db.get_connection() as conn:
+            self.assertFalse(conn.in_transaction)
+        self.assertEqual(self.names('characters'), ['Plume'])
+
+
+if __name__ == '__main__':
+    unittest.main()
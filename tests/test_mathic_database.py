@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Unit tests for mathic/mathic_database.py - MathicDatabase bulk saves
+Checks that save_modules round-trips through load_all_modules like save_module does
+"""
+
+import unittest
+import tempfile
+import sys
+import os
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mathic.mathic_system import Module, Substat
+from mathic.mathic_database import MathicDatabase
+
+
+def make_module(module_id, level=0, substat_count=2):
+    """Build a module with a few substats"""
+    substats = [
+        Substat(stat_name=f'Stat{i}', current_value=float(level + i), rolls_used=i % 2, max_rolls=5)
+        for i in range(substat_count)
+    ]
+    return Module(module_id=module_id, module_type='mask', slot_position=1, level=level,
+                  main_stat='ATK', main_stat_value=10.0 + level, substats=substats)
+
+
+class TestMathicDatabaseBulkSave(unittest.TestCase):
+    """Test suite for MathicDatabase.save_modules"""
+
+    def setUp(self):
+        """Create a fresh database"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db = MathicDatabase(os.path.join(self.temp_dir.name, 'mathic.db'))
+
+    def tearDown(self):
+        """Close the database and remove it"""
+        self.db.close()
+        self.temp_dir.cleanup()
+
+    def test_save_modules_round_trip(self):
+        """Bulk-saved modules load back exactly as saved"""
+        modules = [make_module(f'm{i}', level=i, substat_count=i % 4) for i in range(10)]
+        self.assertTrue(self.db.save_modules(modules))
+
+        loaded = self.db.load_all_modules()
+        self.assertEqual(sorted(loaded), sorted(m.module_id for m in modules))
+        for module in modules:
+            self.assertEqual(loaded[module.module_id].substats, module.substats)
+            self.assertEqual(loaded[module.module_id].main_stat_value, module.main_stat_value)
+
+    def test_save_modules_matches_save_module(self):
+        """Bulk saving gives the same result as saving one module at a time"""
+        modules = [make_module('a', level=1), make_module('b', level=2), make_module('a', level=3, substat_count=1)]
+        other = MathicDatabase(os.path.join(self.temp_dir.name, 'single.db'))
+        try:
+            for module in modules:
+                self.assertTrue(other.save_module(module))
+            self.assertTrue(self.db.save_modules(modules))
+            self.assertEqual(self.db.load_all_modules(), other.load_all_modules())
+        finally:
+            other.close()
+
+        # The repeated module_id keeps its last state
+        self.assertEqual(self.db.load_module('a').main_stat_value, 13.0)
+        self.assertEqual(len(self.db.load_module('a').substats), 1)
+
+    def test_save_modules_empty(self):
+        """An empty batch succeeds without writing anything"""
+        self.assertTrue(self.db.save_modules([]))
+        self.assertEqual(self.db.get_module_count(), 0)
+
+    def test_close_reopens_on_next_use(self):
+        """The shared connection is reopened after close()"""
+        self.assertTrue(self.db.save_modules([make_module('m0')]))
+        self.db.close()
+        self.assertEqual(self.db.get_module_count(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
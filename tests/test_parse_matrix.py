@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Unit tests for html_parser/parse_matrix.py - MatrixEffectsParser extraction
+Checks parsed output against the results of the original parser on a fixture page
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_parser.parse_matrix import MatrixEffectsParser
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'matrix.html')
+
+# Output of the original find_all-based parser for the fixture page
+EXPECTED_MATRIX_EFFECTS = [
+    {
+        'name': 'Wellspring', 'source': 'Dungeon', 'type': ['Healer', 'Support'],
+        'effects': [
+            {'effect': {'HP': '15%'}, 'required': 2, 'total': 4},
+            {'effect': {'Healing Effect': '20%'}, 'required': 4, 'total': 4},
+        ],
+    },
+    {
+        'name': 'Nested', 'source': 'Shop', 'type': ['DPS'],
+        'effects': [{'effect': {'ATK': '10%'}, 'required': 2, 'total': 4}],
+    },
+    {
+        'name': 'Quiet',
+        'effects': [{'effect': {'SPD': '8%'}, 'required': 2, 'total': 2}],
+    },
+]
+
+
+class TestMatrixEffectsParser(unittest.TestCase):
+    """Test suite for MatrixEffectsParser extraction"""
+
+    def setUp(self):
+        """Load the fixture page"""
+        self.parser = MatrixEffectsParser(FIXTURE_PATH, use_database=False)
+        self.assertTrue(self.parser.load_html())
+
+    def test_extract_matrix_effects_matches_baseline(self):
+        """Nested and wrapped matrix boxes are all found, in document order"""
+        self.parser.extract_matrix_effects()
+        self.assertEqual(self.parser.matrix_effects, EXPECTED_MATRIX_EFFECTS)
+
+
+if __name__ == '__main__':
+    unittest.main()
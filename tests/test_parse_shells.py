@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Unit tests for html_parser/parse_shells.py - ShellParser extraction
+Checks parsed output against the results of the original parser on a fixture page
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_parser.parse_shells import ShellParser
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'shells.html')
+
+# Output of the original find_all-based parser for the fixture page
+EXPECTED_SHELLS = [
+    {
+        'name': 'Aurora', 'rarity': 'SSR', 'class': 'Support', 'cooldown': '4 turns',
+        'skills': {'awakened': 'Heals  all allies.', 'non_awakened': 'Heals one ally.'},
+        'stats': {'HP': '10%', 'ATK': '5'},
+        'sets': ['Wellspring', 'Quiet'],
+    },
+    {
+        'name': 'Bastion(new)', 'rarity': 'SR', 'class': 'Defender', 'cooldown': '3 turns',
+        'skills': {'non_awakened': 'Taunts.'},
+        'stats': {'DEF': '12% : bonus'},
+        'sets': ['Iron_wall'],
+    },
+    {'name': 'Bare', 'rarity': 'Unknown', 'class': 'Unknown', 'cooldown': 'Unknown'},
+    {'name': 'Half', 'rarity': 'R', 'class': 'Unknown', 'cooldown': 'Unknown'},
+]
+
+
+class TestShellParser(unittest.TestCase):
+    """Test suite for ShellParser extraction"""
+
+    def setUp(self):
+        """Load the fixture page"""
+        self.parser = ShellParser(FIXTURE_PATH, use_database=False)
+        self.assertTrue(self.parser.load_html())
+
+    def test_parse_all_shells_matches_baseline(self):
+        """Sequential parsing reproduces the original parser's output"""
+        self.assertEqual(self.parser.parse_all_shells(), EXPECTED_SHELLS)
+
+    def test_parallel_parse_matches_baseline(self):
+        """Parsing in worker processes gives the same output"""
+        self.assertEqual(self.parser.parse_all_shells(parallel=True, max_workers=2), EXPECTED_SHELLS)
+
+    def test_extractors_work_without_view(self):
+        """Extractors called on a bare element find their own parts"""
+        self.parser.parse_all_shells()
+        shell_element = self.parser.soup.find('div', class_='single-shell')
+        self.assertEqual(self.parser.extract_shell_stats(shell_element), EXPECTED_SHELLS[0]['stats'])
+        self.assertEqual(self.parser.extract_matrix_sets(shell_element), EXPECTED_SHELLS[0]['sets'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Unit tests for db/shells_db.py - ShellsDatabase summary counts
+Checks the trigger-maintained shell_aggregates table against live GROUP BY queries
+"""
+
+import unittest
+import tempfile
+import sys
+import os
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.shells_db import ShellsDatabase
+
+
+def make_shell(name, rarity='SSR', shell_class='Support', sets=()):
+    """Build a minimal shell"""
+    return {'name': name, 'rarity': rarity, 'class': shell_class, 'cooldown': '4 turns',
+            'skills': {'awakened': 'Heals all.'}, 'stats': {'HP': '10%'}, 'sets': list(sets)}
+
+
+class TestShellsDatabaseSummary(unittest.TestCase):
+    """Test suite for ShellsDatabase.get_stats_summary"""
+
+    def setUp(self):
+        """Create a database with a few shells"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db = ShellsDatabase(os.path.join(self.temp_dir.name, 'shells.db'))
+        self.db.insert_shell(make_shell('Aurora', 'SSR', 'Support', ['Bloom', 'Quiet']))
+        self.db.insert_shell(make_shell('Bastion', 'SR', 'Defender', ['Bloom']))
+        self.db.insert_shell(make_shell('Cinder', 'SSR', 'Attacker', ['Ember']))
+
+    def tearDown(self):
+        """Remove the database"""
+        self.temp_dir.cleanup()
+
+    def live_summary(self):
+        """Compute the summary with GROUP BY queries over the base tables"""
+        with self.db.get_connection() as conn:
+            total_count = conn.execute('SELECT COUNT(*) FROM shells').fetchone()[0]
+            rarity_counts = dict(conn.execute('SELECT rarity, COUNT(*) FROM shells GROUP BY rarity').fetchall())
+            class_counts = dict(conn.execute('SELECT class, COUNT(*) FROM shells GROUP BY class').fetchall())
+            matrix_set_counts = dict(conn.execute('''
+                SELECT matrix_set_name, COUNT(*) FROM shell_matrix_sets
+                GROUP BY matrix_set_name ORDER BY COUNT(*) DESC LIMIT 10
+            ''').fetchall())
+        return {
+            'total_count': total_count,
+            'rarity_counts': rarity_counts,
+            'class_counts': class_counts,
+            'matrix_set_counts': matrix_set_counts
+        }
+
+    def assertSummaryInSync(self):
+        """The aggregate-backed summary matches the live counts"""
+        self.assertEqual(self.db.get_stats_summary(), self.live_summary())
+
+    def test_summary_after_inserts(self):
+        """Inserted shells are counted"""
+        self.assertSummaryInSync()
+        self.assertEqual(self.db.get_stats_summary()['rarity_counts'], {'SSR': 2, 'SR': 1})
+
+    def test_summary_after_replace(self):
+        """INSERT OR REPLACE of an existing shell moves its counts instead of adding to them"""
+        self.db.insert_shell(make_shell('Aurora', 'SR', 'Healer', ['Ember']))
+        self.assertSummaryInSync()
+        self.assertEqual(self.db.get_stats_summary()['total_count'], 3)
+
+    def test_summary_after_update_and_delete(self):
+        """Direct updates and deletes keep the counts in sync"""
+        with self.db.get_connection() as conn:
+            conn.execute("UPDATE shells SET rarity = 'R', class = 'Support' WHERE name = 'Cinder'")
+            conn.execute("DELETE FROM shell_matrix_sets WHERE matrix_set_name = 'Quiet'")
+            conn.execute("DELETE FROM shells WHERE name = 'Bastion'")
+            conn.commit()
+        self.assertSummaryInSync()
+
+    def test_summary_after_clear(self):
+        """Clearing all data resets every count"""
+        self.db.clear_all_data()
+        self.assertSummaryInSync()
+        self.db.insert_shell(make_shell('Aurora'))
+        self.assertSummaryInSync()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Unit tests for db/unified_db.py - EtheriaDatabase connection lifetime
+Checks that the shared connection is closed on close() and when the database is collected
+"""
+
+import unittest
+import tempfile
+import weakref
+import sqlite3
+import sys
+import os
+import gc
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.unified_db import EtheriaDatabase
+
+
+class TestEtheriaDatabaseLifetime(unittest.TestCase):
+    """Test suite for the EtheriaDatabase shared connection lifetime"""
+
+    def setUp(self):
+        """Create a temporary directory for the databases"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove the databases"""
+        self.temp_dir.cleanup()
+
+    def test_collected_database_closes_its_connection(self):
+        """A database dropped without close() is not kept alive and its connection is closed"""
+        db = EtheriaDatabase(os.path.join(self.temp_dir.name, 'etheria.db'))
+        with db.get_connection() as conn:
+            pass
+        db_ref = weakref.ref(db)
+        del db
+        gc.collect()
+
+        self.assertIsNone(db_ref())
+        with self.assertRaises(sqlite3.ProgrammingError):
+            conn.execute('SELECT 1')
+
+    def test_close_then_reuse(self):
+        """close() can be called twice and the next use reopens the connection"""
+        db = EtheriaDatabase(os.path.join(self.temp_dir.name, 'etheria.db'))
+        with db.get_connection() as conn:
+            pass
+        db.close()
+        db.close()
+
+        with self.assertRaises(sqlite3.ProgrammingError):
+            conn.execute('SELECT 1')
+        with db.get_connection() as conn:
+            self.assertEqual(conn.execute('SELECT 1').fetchone()[0], 1)
+        db.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -126,11 +126,11 @@ class CharacterModel(BaseModel):
     def get_rarities(self):
         """Get available rarities from database"""
         query = "SELECT DISTINCT rarity FROM characters ORDER BY rarity"
-        results = self.manager.db.execute_query(query)
+        results = self.manager.db.execute_query(query, as_dict=False)
         return [row['rarity'] for row in results]
     
     def get_elements(self):
         """Get available elements from database"""
         query = "SELECT DISTINCT element FROM characters ORDER BY element"
-        results = self.manager.db.execute_query(query)
+        results = self.manager.db.execute_query(query, as_dict=False)
         return [row['element'] for row in results]
@@ -40,19 +40,19 @@ class ShellModel(BaseModel):
     def get_all_matrix_effects(self):
         """Get all available matrix effects for filtering"""
         query = "SELECT DISTINCT name FROM matrix_effects ORDER BY name"
-        results = self.manager.db.execute_query(query)
+        results = self.manager.db.execute_query(query, as_dict=False)
         return [row['name'] for row in results]
     
     def get_shell_classes(self):
         """Get available shell classes from database"""
         query = "SELECT DISTINCT class FROM shells ORDER BY class"
-        results = self.manager.db.execute_query(query)
+        results = self.manager.db.execute_query(query, as_dict=False)
         return [row['class'] for row in results]
     
     def get_shell_rarities(self):
         """Get available shell rarities from database"""
         query = "SELECT DISTINCT rarity FROM shells ORDER BY rarity"
-        results = self.manager.db.execute_query(query)
+        results = self.manager.db.execute_query(query, as_dict=False)
         return [row['rarity'] for row in results]
     
     def filter_shells_by_matrix(self, matrix_names):
@@ -73,7 +73,7 @@ class ShellModel(BaseModel):
         """
         
         params = matrix_names + [len(matrix_names)]
-        results = self.manager.db.execute_query(query, params)
+        results = self.manager.db.execute_query(query, params, as_dict=False)
         
         filtered_shells = []
         for row in results:
@@ -100,7 +100,7 @@ class ShellModel(BaseModel):
             ORDER BY matching_matrices DESC, s.name
         """
         
-        results = self.manager.db.execute_query(query, matrix_names)
+        results = self.manager.db.execute_query(query, matrix_names, as_dict=False)
         
         filtered_shells = []
         for row in results:
@@ -154,7 +154,7 @@ class ShellModel(BaseModel):
         
         query += " ORDER BY s.name"
         
-        results = self.manager.db.execute_query(query, params)
+        results = self.manager.db.execute_query(query, params, as_dict=False)
         
         filtered_shells = []
         for row in results:
@@ -190,7 +190,7 @@ class ShellModel(BaseModel):
             WHERE name LIKE ? 
             ORDER BY name
         """
-        results = self.manager.db.execute_query(query, (f'%{name_like}%',))
+        results = self.manager.db.execute_query(query, (f'%{name_like}%',), as_dict=False)
         
         filtered_shells = []
         for row in results:
@@ -2057,6 +2057,8 @@ def main():
         print("\nApplication closed by user")
     except Exception as e:
         print(f"Application error: {e}")
+    finally:
+        app.mathic_system.close()
 
 
 if __name__ == "__main__":
@@ -95,6 +95,8 @@ class EtheriaApplication:
             print(f"Application error: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            self.models['mathic'].mathic_system.close()
     
     def get_models(self):
         """Get application models"""